@@ -0,0 +1,286 @@
+#   Caché de resultados de simulación direccionada por contenido.
+#   La clave de una corrida es el SHA-256 de la versión del simulador, la
+#   política de reemplazo, los TAMANO_*, la tabla de mapeos y el contenido de
+#   la traza. Si ya se simuló exactamente lo mismo se devuelven las
+#   estadísticas guardadas y, si se pidió, el estado final (ambos en JSON).
+#   La traza se hashea ya convertida a enteros, así '46' y 70 dan la misma
+#   clave: simular() las trata igual.
+#
+#   Los resultados van en el directorio de caché del usuario
+#   ($XDG_CACHE_HOME/mmu/resultados o ~/.cache/mmu/resultados). El directorio
+#   tiene un tamaño máximo: al pasarlo se borran primero las corridas usadas
+#   hace más tiempo (cada lectura actualiza la fecha del archivo).
+#
+#   Uso:
+#     python cache_resultados.py config1.txt [--estado] [--sin-cache] [--limpiar]
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from array import array
+from itertools import islice
+
+from traduccion_LFU import TraductorDeDirecciones, VERSION_SIMULADOR
+from cargarDatos import cargar_configuracion_rapida
+
+DIRECTORIO_RESULTADOS = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                                     'mmu', 'resultados')
+TAMANO_MAXIMO_CACHE = 256 * 1024 * 1024
+POLITICA = 'LFU'
+
+_CLAVES_CONFIGURACION = ('TAMANO_MEMORIA_VIRTUAL', 'TAMANO_MEMORIA_FISICA', 'TAMANO_PAGINA')
+_TAMANO_TROZO = 1 << 16
+_MAXIMA_DIRECCION = (1 << 64) - 1
+
+
+def _direccion_entera(dv):
+    """La dirección como la ve simular(): int tal cual, string como hex; None si no es válida."""
+    if not isinstance(dv, int):
+        try:
+            dv = int(str(dv), 16)
+        except ValueError:
+            return None
+    return dv if 0 <= dv <= _MAXIMA_DIRECCION else None
+
+
+def clave_corrida(configuracion, mapas, direcciones, politica=POLITICA):
+    """
+    Huella SHA-256 (hex) de una corrida. mapas son las entradas ya decodificadas
+    (int); la traza se recorre por trozos, sin copiarla entera a memoria. Cada
+    dirección se convierte a int (como en simular()) y se hashea en 8 bytes
+    little-endian; las que no son válidas (hex mal formado, negativas o de más
+    de 64 bits, que simular() cuenta como inválidas) se hashean aparte por posición.
+    """
+    h = hashlib.sha256()
+    h.update(f"simulador={VERSION_SIMULADOR};politica={politica};".encode())
+    for clave in _CLAVES_CONFIGURACION:
+        h.update(f"{clave}={configuracion[clave]};".encode())
+    h.update(b"MAPEOS;")
+    h.update(";".join(f"{pagina}:{entrada:X}" for pagina, entrada in sorted(mapas.items())).encode())
+    h.update(b";DIRECCIONES;")
+    iterador = iter(direcciones)
+    invalidas = array('Q')
+    posicion = 0
+    while True:
+        trozo = [_direccion_entera(dv) for dv in islice(iterador, _TAMANO_TROZO)]
+        if not trozo:
+            break
+        for i, dv in enumerate(trozo):
+            if dv is None:
+                invalidas.append(posicion + i)
+                trozo[i] = 0
+        valores = array('Q', trozo)
+        if sys.byteorder != 'little':
+            valores.byteswap()
+        h.update(valores.tobytes())
+        posicion += len(trozo)
+    if sys.byteorder != 'little':
+        invalidas.byteswap()
+    h.update(f";ACCESOS={posicion};INVALIDAS;".encode())
+    h.update(invalidas.tobytes())
+    return h.hexdigest()
+
+
+class CacheResultados:
+    """Resultados guardados como <clave>.json (estadísticas) y <clave>.estado (estado final en JSON, opcional)."""
+
+    def __init__(self, directorio=DIRECTORIO_RESULTADOS, tamano_maximo=TAMANO_MAXIMO_CACHE):
+        self.directorio = directorio
+        self.tamano_maximo = tamano_maximo
+
+    def _ruta(self, clave, extension):
+        return os.path.join(self.directorio, f"{clave}.{extension}")
+
+    def obtener(self, clave, con_estado=False):
+        """(estadisticas, estado) de la corrida, o None si no está (o falta el estado pedido)."""
+        ruta_json = self._ruta(clave, 'json')
+        try:
+            with open(ruta_json, 'r') as f:
+                estadisticas = json.load(f)
+            estado = None
+            if con_estado:
+                with open(self._ruta(clave, 'estado'), 'r') as f:
+                    estado = _estado_desde_json(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        # recién usada: la fecha de modificación es el orden del desalojo
+        try:
+            os.utime(ruta_json)
+        except OSError:
+            pass
+        return estadisticas, estado
+
+    def _escribir(self, ruta, escribir, modo):
+        ruta_tmp = f'{ruta}.{os.getpid()}.tmp'
+        with open(ruta_tmp, modo) as f:
+            escribir(f)
+        os.replace(ruta_tmp, ruta)  # escritura atómica
+
+    def guardar(self, clave, estadisticas, estado=None):
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            if estado is not None:
+                self._escribir(self._ruta(clave, 'estado'),
+                               lambda f: json.dump(_estado_a_json(estado), f), 'w')
+            # el JSON va último: una corrida sólo existe cuando está completa
+            self._escribir(self._ruta(clave, 'json'),
+                           lambda f: json.dump(estadisticas, f, sort_keys=True), 'w')
+            self.recortar()
+        except OSError as e:
+            print(f"⚠️ No se pudo guardar el resultado en caché: {e}", file=sys.stderr)
+
+    def _corridas(self):
+        """{clave: (fecha de uso, bytes)} de las corridas guardadas."""
+        corridas = {}
+        try:
+            nombres = os.listdir(self.directorio)
+        except FileNotFoundError:
+            return corridas
+        for nombre in nombres:
+            clave, _, extension = nombre.partition('.')
+            if extension not in ('json', 'estado'):
+                continue
+            try:
+                info = os.stat(os.path.join(self.directorio, nombre))
+            except OSError:
+                continue
+            fecha, tamano = corridas.get(clave, (0, 0))
+            if extension == 'json':
+                fecha = info.st_mtime
+            corridas[clave] = (fecha, tamano + info.st_size)
+        return corridas
+
+    def tamano(self):
+        return sum(tamano for _, tamano in self._corridas().values())
+
+    def recortar(self):
+        """Borra las corridas menos recientemente usadas hasta quedar por debajo de tamano_maximo."""
+        corridas = self._corridas()
+        total = sum(tamano for _, tamano in corridas.values())
+        for clave, (_, tamano) in sorted(corridas.items(), key=lambda c: c[1][0]):
+            if total <= self.tamano_maximo:
+                break
+            self.borrar(clave)
+            total -= tamano
+
+    def borrar(self, clave):
+        for extension in ('json', 'estado'):
+            try:
+                os.remove(self._ruta(clave, extension))
+            except FileNotFoundError:
+                pass
+
+    def limpiar(self):
+        for clave in self._corridas():
+            self.borrar(clave)
+
+
+def estado_traductor(traductor):
+    """Estado final del traductor que vale la pena guardar (sin la configuración)."""
+    return {
+        'tabla_de_paginas': dict(traductor.tabla_de_paginas.items()),
+        'frecuencias_uso': dict(traductor.frecuencias_uso),
+        'marcos_ocupados': set(traductor.marcos_ocupados),
+        'fallos_pagina': traductor.fallos_pagina,
+    }
+
+
+def _estado_a_json(estado):
+    """Estado con claves int como listas de pares (JSON sólo admite claves string)."""
+    return {
+        'tabla_de_paginas': list(estado['tabla_de_paginas'].items()),
+        'frecuencias_uso': list(estado['frecuencias_uso'].items()),
+        'marcos_ocupados': sorted(estado['marcos_ocupados']),
+        'fallos_pagina': estado['fallos_pagina'],
+    }
+
+
+def _estado_desde_json(datos):
+    return {
+        'tabla_de_paginas': {int(pagina): int(entrada) for pagina, entrada in datos['tabla_de_paginas']},
+        'frecuencias_uso': {int(pagina): int(cuenta) for pagina, cuenta in datos['frecuencias_uso']},
+        'marcos_ocupados': {int(marco) for marco in datos['marcos_ocupados']},
+        'fallos_pagina': int(datos['fallos_pagina']),
+    }
+
+
+def restaurar_estado(traductor, estado):
+    """Deja un traductor recién creado (misma configuración) en el estado guardado."""
+    traductor.restaurar(estado)
+
+
+def simular(configuracion, mapas, direcciones):
+    """Corrida completa sin salida. Devuelve (estadisticas, traductor)."""
+    traductor = TraductorDeDirecciones(
+        configuracion['TAMANO_MEMORIA_VIRTUAL'],
+        configuracion['TAMANO_MEMORIA_FISICA'],
+        configuracion['TAMANO_PAGINA'],
+        mapas,
+        entradas_decodificadas=True
+    )
+    accesos = invalidas = 0
+    traducir = traductor.traducir_silencioso
+    for dv in direcciones:
+        accesos += 1
+        if traducir(dv)[0] is None:
+            invalidas += 1
+    estadisticas = {
+        'accesos': accesos,
+        'invalidas': invalidas,
+        'fallos_pagina': traductor.fallos_pagina,
+        'tasa_fallos': traductor.fallos_pagina / accesos if accesos else 0.0,
+        'marcos_ocupados': len(traductor.marcos_ocupados),
+    }
+    return estadisticas, traductor
+
+
+def simular_con_cache(configuracion, mapas, direcciones, cache=None, con_estado=False):
+    """
+    Como simular(), pero devuelve el resultado guardado si la corrida ya se hizo.
+    direcciones debe ser una secuencia (se recorre una vez para la clave y otra para simular).
+    Devuelve (estadisticas, estado, desde_cache); estado es None si no se pidió.
+    """
+    cache = CacheResultados() if cache is None else cache
+    clave = clave_corrida(configuracion, mapas, direcciones)
+    guardado = cache.obtener(clave, con_estado)
+    if guardado is not None:
+        return guardado[0], guardado[1], True
+
+    estadisticas, traductor = simular(configuracion, mapas, direcciones)
+    estado = estado_traductor(traductor) if con_estado else None
+    cache.guardar(clave, estadisticas, estado)
+    return estadisticas, estado, False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulación con caché de resultados")
+    parser.add_argument('config', nargs='?', default='config1.txt')
+    parser.add_argument('--estado', action='store_true', help="guardar/recuperar también el estado final")
+    parser.add_argument('--sin-cache', action='store_true', help="simular siempre, sin leer ni guardar")
+    parser.add_argument('--limpiar', action='store_true', help="vaciar la caché de resultados y salir")
+    parser.add_argument('--tamano-maximo', type=int, default=TAMANO_MAXIMO_CACHE, help="bytes")
+    args = parser.parse_args()
+
+    cache = CacheResultados(tamano_maximo=args.tamano_maximo)
+    if args.limpiar:
+        cache.limpiar()
+        print("✅ Caché de resultados vacía.")
+        sys.exit(0)
+
+    try:
+        configuracion, mapas, direcciones_vi_hex = cargar_configuracion_rapida(args.config)
+        if args.sin_cache:
+            estadisticas, _ = simular(configuracion, mapas, direcciones_vi_hex)
+            desde_cache = False
+        else:
+            estadisticas, _, desde_cache = simular_con_cache(configuracion, mapas, direcciones_vi_hex,
+                                                             cache, args.estado)
+    except (ValueError, KeyError) as e:
+        print(f"❌ Error durante la simulación: {e}")
+        sys.exit(1)
+
+    print(f"Resultado {'recuperado de la caché' if desde_cache else 'simulado'}:")
+    for clave, valor in estadisticas.items():
+        print(f"  {clave:<18}{valor:.4f}" if isinstance(valor, float) else f"  {clave:<18}{valor}")
@@ -1,5 +1,10 @@
 import sys
 import math
+import os
+import re
+import marshal
+import hashlib
+from itertools import repeat
 
 # Nota: Asumo que la clase TraductorDeDirecciones y la función imprimir_binario
 # están definidas en este mismo script o han sido importadas.
@@ -81,4 +86,187 @@ def cargar_configuracion_desde_archivo(nombre_archivo):
         sys.exit(1)
     except Exception as e:
         print(f"❌ Error al procesar el archivo de configuración: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+
+# --- Carga rápida (en bloque) con caché en disco ---
+
+# Directorio (junto al archivo de configuración) donde se guardan las configuraciones ya parseadas
+DIRECTORIO_CACHE = '.cache_mmu'
+# Se incrementa si cambia el formato de lo que se guarda en la caché
+_VERSION_CACHE = 2
+# Cabecera de los archivos de caché: marca + versión. El contenido es marshal de
+# datos planos (dicts, listas, str, int): nunca se ejecuta código al leerlo.
+_CABECERA_CACHE = b'MMUCFG' + bytes([_VERSION_CACHE])
+
+_PATRON_SECCION = re.compile(r'^[ \t]*(MAPEOS_EMPAQUETADOS|DIRECCIONES_VI):[ \t]*\r?$', re.M)
+_PATRON_MAPEO = re.compile(r'^[ \t]*(\d+)[ \t]*:[ \t]*([0-9A-Fa-f]+)[ \t]*\r?$', re.M)
+
+
+def _lineas_utiles(texto):
+    """Devuelve las líneas no vacías y que no son comentarios (ya sin espacios)."""
+    return [l.strip() for l in texto.splitlines() if l.strip() and not l.strip().startswith('#')]
+
+
+def _decodificar_mapeos(cuerpo):
+    """
+    Decodifica un bloque de líneas 'pagina:HEX' a un dict {pagina: entrada_int}.
+    Camino rápido: si cada token del bloque contiene exactamente un ':' (el caso
+    habitual, sin espacios ni comentarios), se une todo y se parte una sola vez.
+    Si no, se usa la expresión regular. Devuelve None si hay líneas inválidas.
+    """
+    tokens = cuerpo.split()
+    if '#' not in cuerpo and cuerpo.count(':') == len(tokens) and all(map(str.__contains__, tokens, repeat(':'))):
+        campos = ':'.join(tokens).split(':')
+        try:
+            return dict(zip(map(int, campos[0::2]), [int(v, 16) for v in campos[1::2]]))
+        except ValueError:
+            return None
+
+    pares = _PATRON_MAPEO.findall(cuerpo)
+    if len(pares) != len(_lineas_utiles(cuerpo)):
+        return None
+    return {int(p): int(v, 16) for p, v in pares}
+
+
+def _parsear_configuracion_en_bloque(texto):
+    """
+    Parsea el contenido completo del archivo de configuración. La sección
+    MAPEOS_EMPAQUETADOS se decodifica con una sola expresión regular sobre todo
+    el bloque, y los valores se devuelven ya como enteros (entradas empaquetadas),
+    listos para TraductorDeDirecciones(..., entradas_decodificadas=True).
+    Devuelve None si alguna línea del bloque no tiene el formato 'pagina:HEX'.
+    """
+    config = {}
+    tabla_decodificada = {}
+    direcciones_virtuales = []
+
+    # Partir el texto en secciones: [config] (cabecera, cuerpo)*
+    partes = _PATRON_SECCION.split(texto)
+    secciones = [(None, partes[0])] + list(zip(partes[1::2], partes[2::2]))
+
+    for cabecera, cuerpo in secciones:
+        if cabecera == 'DIRECCIONES_VI':
+            direcciones_virtuales.extend(_lineas_utiles(cuerpo))
+        elif cabecera == 'MAPEOS_EMPAQUETADOS':
+            mapeos = _decodificar_mapeos(cuerpo)
+            if mapeos is None:
+                return None
+            tabla_decodificada.update(mapeos)
+        else:
+            for linea in _lineas_utiles(cuerpo):
+                if ':' not in linea:
+                    return None
+                clave, valor = linea.split(':', 1)
+                try:
+                    config[clave.strip()] = int(valor.strip())
+                except ValueError:
+                    return None
+
+    return config, tabla_decodificada, direcciones_virtuales
+
+
+def _leer_cache(ruta_cache):
+    """Resultado guardado en ruta_cache, o None si no existe o no tiene el formato esperado."""
+    try:
+        with open(ruta_cache, 'rb') as f:
+            datos = f.read()
+    except OSError:
+        return None
+    if not datos.startswith(_CABECERA_CACHE):
+        return None
+    try:
+        resultado = marshal.loads(datos[len(_CABECERA_CACHE):])
+    except (ValueError, EOFError, TypeError):
+        return None
+    if (not isinstance(resultado, tuple) or len(resultado) != 3
+            or not isinstance(resultado[0], dict) or not isinstance(resultado[1], dict)
+            or not isinstance(resultado[2], list)):
+        return None
+    return resultado
+
+
+def _borrar_caches_viejas(directorio_cache, prefijo, ruta_actual):
+    """
+    Borra del directorio las cachés de versiones anteriores del formato y las
+    de contenidos anteriores del mismo archivo (prefijo): queda una por archivo.
+    """
+    try:
+        nombres = os.listdir(directorio_cache)
+    except OSError:
+        return
+    for nombre in nombres:
+        ruta = os.path.join(directorio_cache, nombre)
+        vieja_version = nombre.startswith('config_v') and not nombre.startswith(f'config_v{_VERSION_CACHE}_')
+        if ruta != ruta_actual and (vieja_version or nombre.startswith(prefijo)):
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+
+
+def cargar_configuracion_rapida(nombre_archivo, usar_cache=True, directorio_cache=None):
+    """
+    Variante de cargar_configuracion_desde_archivo pensada para archivos con
+    millones de mapeos. Devuelve (config, tabla_decodificada, direcciones_virtuales),
+    donde tabla_decodificada ya contiene las entradas empaquetadas como int.
+
+    El resultado se guarda en disco indexado por el hash SHA-256 del contenido
+    del archivo, de modo que las ejecuciones repetidas con la misma
+    configuración no vuelven a parsear nada. Por defecto la caché va en
+    DIRECTORIO_CACHE junto al archivo de configuración; se guarda sólo la del
+    contenido actual de cada archivo (al cambiarlo se borra la anterior). Si el archivo tiene líneas con
+    formato incorrecto se recurre al parser línea a línea (mismos mensajes de error).
+    Los avisos y errores propios de esta función van a stderr.
+    """
+    try:
+        with open(nombre_archivo, 'rb') as f:
+            contenido = f.read()
+    except FileNotFoundError:
+        print(f"❌ Error: No se encontró el archivo '{nombre_archivo}'.", file=sys.stderr)
+        sys.exit(1)
+
+    if directorio_cache is None:
+        directorio_cache = os.path.join(os.path.dirname(os.path.abspath(nombre_archivo)), DIRECTORIO_CACHE)
+    huella = hashlib.sha256(contenido).hexdigest()
+    # la ruta del archivo (abreviada) identifica de quién es cada caché
+    prefijo = f'config_v{_VERSION_CACHE}_{hashlib.sha256(os.path.abspath(nombre_archivo).encode()).hexdigest()[:16]}_'
+    ruta_cache = os.path.join(directorio_cache, f'{prefijo}{huella}.bin')
+
+    if usar_cache:
+        resultado = _leer_cache(ruta_cache)
+        if resultado is not None:
+            return resultado
+        # no hay caché válida: parsear normalmente
+
+    resultado = _parsear_configuracion_en_bloque(contenido.decode('utf-8'))
+    if resultado is None:
+        config, tabla_empaquetada, direcciones_virtuales = cargar_configuracion_desde_archivo(nombre_archivo)
+        tabla_decodificada = {}
+        for pagina, valor in tabla_empaquetada.items():
+            try:
+                tabla_decodificada[pagina] = int(valor, 16)
+            except ValueError:
+                print(f"❌ Error: La entrada '{valor}' de la página {pagina} no es hexadecimal.", file=sys.stderr)
+                sys.exit(1)
+        # con líneas erróneas no se guarda en caché: los avisos deben volver a mostrarse
+        return config, tabla_decodificada, direcciones_virtuales
+
+    config = resultado[0]
+    if not all(k in config for k in ['TAMANO_MEMORIA_VIRTUAL', 'TAMANO_MEMORIA_FISICA', 'TAMANO_PAGINA']):
+        print("❌ Error al procesar el archivo de configuración: "
+              "El archivo de configuración no contiene todas las claves de memoria necesarias.", file=sys.stderr)
+        sys.exit(1)
+
+    if usar_cache:
+        try:
+            os.makedirs(directorio_cache, exist_ok=True)
+            ruta_tmp = f'{ruta_cache}.{os.getpid()}.tmp'
+            with open(ruta_tmp, 'wb') as f:
+                f.write(_CABECERA_CACHE + marshal.dumps(resultado))
+            os.replace(ruta_tmp, ruta_cache)  # escritura atómica
+            _borrar_caches_viejas(directorio_cache, prefijo, ruta_cache)
+        except OSError as e:
+            print(f"⚠️ No se pudo guardar la caché de configuración: {e}", file=sys.stderr)
+
+    return resultado
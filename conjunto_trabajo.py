@@ -0,0 +1,385 @@
+#   Asignación dinámica de marcos entre procesos por conjunto de trabajo (WS)
+#   o por frecuencia de fallos de página (PFF).
+#   Cada proceso tiene su propio espacio de direcciones (un TraductorProceso)
+#   y todos toman marcos de un único pool físico. Cada proceso tiene un límite
+#   de marcos: por debajo del límite toma marcos libres del pool; al llegar a
+#   él reemplaza (LFU) entre sus propias páginas.
+#
+#   Cada 'intervalo' accesos se recalcula la demanda de cada proceso:
+#     ws  - páginas distintas referenciadas en sus últimos 'delta' accesos.
+#     pff - el límite crece si su tasa de fallos pasó pff_alto y baja si quedó
+#           por debajo de pff_bajo.
+#   Si la demanda total de los procesos activos supera los marcos físicos hay
+#   hiperpaginación: se suspenden procesos (el de mayor demanda primero, y se
+#   desalojan todas sus páginas) hasta que la demanda quepa. Los suspendidos se
+#   reanudan, en orden de llegada, cuando vuelve a haber marcos para su demanda.
+#
+#   Formato de la traza (una línea por acceso):  PID:DV   (DV en hexadecimal)
+#
+#   Uso:
+#     python conjunto_trabajo.py config.txt traza.txt --politica ws --delta 2000
+
+import sys
+import heapq
+import argparse
+from collections import deque
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+from simulacion_paralela import leer_traza_con_procesos
+
+POLITICAS = ('ws', 'pff')
+
+
+class PoolMarcos:
+    """Marcos físicos libres compartidos por todos los procesos (se entrega siempre el más bajo)."""
+
+    def __init__(self, num_marcos):
+        self.num_marcos = num_marcos
+        self._libres = list(range(num_marcos))
+
+    def tomar(self):
+        return heapq.heappop(self._libres) if self._libres else None
+
+    def devolver(self, marco):
+        heapq.heappush(self._libres, marco)
+
+    def libres(self):
+        return len(self._libres)
+
+
+class TraductorProceso(TraductorDeDirecciones):
+    """
+    Espacio de direcciones de un proceso. Los números de marco son los del pool
+    global; marcos_ocupados son los marcos que tiene este proceso.
+    """
+
+    def __init__(self, pid, pool, limite, tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina):
+        super().__init__(tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, {},
+                         entradas_decodificadas=True)
+        self.pid = pid
+        self.pool = pool
+        self.limite = limite
+        self.reloj = 0          # tiempo virtual del proceso: sus propios accesos
+        self.ultimo_uso = {}    # página -> reloj de su última referencia
+        self.sin_marco = 0      # accesos que no consiguieron marco
+        self.fallos_ventana = 0
+        self.accesos_ventana = 0
+        # si devuelve True, el proceso puede pasarse de su límite con un marco libre que nadie tiene reservado
+        self.puede_exceder = lambda: False
+
+    def residentes(self):
+        return len(self._paginas_presentes)
+
+    def _encontrar_marco_libre(self):
+        # al llegar al límite se reemplaza dentro del propio proceso
+        if len(self.marcos_ocupados) >= self.limite and not self.puede_exceder():
+            return None
+        return self.pool.tomar()
+
+    def _liberar_marco(self, marco):
+        super()._liberar_marco(marco)
+        self.pool.devolver(marco)
+
+    def desalojar(self, pagina):
+        """Saca la página de memoria y devuelve su marco al pool."""
+        entrada = self.tabla_de_paginas[pagina]
+        self.tabla_de_paginas[pagina] = entrada & ~self.MASK_PRESENTE
+        self._paginas_presentes.discard(pagina)
+        self.frecuencias_uso[pagina] = 0
+        self._liberar_marco(entrada & self.MASK_MARCO)
+
+    def recortar(self, limite, conjunto_trabajo=None):
+        """
+        Fija el límite y desaloja lo que sobre. Con conjunto_trabajo se desalojan
+        además todas las páginas que quedaron fuera de él (el conjunto residente
+        es el conjunto de trabajo); si aun así sobran, se desaloja por LFU.
+        """
+        self.limite = limite
+        if conjunto_trabajo is not None:
+            for pagina in self._paginas_presentes - conjunto_trabajo:
+                self.desalojar(pagina)
+        for _ in range(self.residentes() - limite):
+            self.desalojar(self._seleccionar_victima_LFU())
+
+    def conjunto_trabajo(self, delta):
+        """Páginas referenciadas en los últimos delta accesos (y olvida las más viejas)."""
+        desde = self.reloj - delta
+        viejas = [p for p, t in self.ultimo_uso.items() if t <= desde]
+        for pagina in viejas:
+            del self.ultimo_uso[pagina]
+        return set(self.ultimo_uso)
+
+    def acceder(self, direccion_virtual):
+        self.reloj += 1
+        self.accesos_ventana += 1
+        fallos_previos = self.fallos_pagina
+        direccion_fisica = self.traducir_entero(direccion_virtual)
+        if self.fallos_pagina != fallos_previos:
+            self.fallos_ventana += 1
+            if direccion_fisica is None:
+                self.sin_marco += 1
+        if direccion_fisica is not None:
+            self.ultimo_uso[direccion_virtual >> self.bits_desplazamiento] = self.reloj
+        return direccion_fisica
+
+
+class GestorConjuntos:
+    """
+    Reparte los marcos físicos entre procesos según su demanda y suspende
+    procesos cuando hay hiperpaginación. simular() planifica los procesos
+    activos por turnos (quantum accesos cada uno).
+    """
+
+    def __init__(self, tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, politica='ws',
+                 delta=1_000, intervalo=1_000, pff_alto=0.02, pff_bajo=0.005, paso_pff=0.1):
+        if politica not in POLITICAS:
+            raise ValueError(f"Política '{politica}' desconocida (opciones: {', '.join(POLITICAS)})")
+        if delta <= 0 or intervalo <= 0:
+            raise ValueError("delta e intervalo deben ser > 0")
+        if pff_bajo > pff_alto:
+            raise ValueError("pff_bajo no puede ser mayor que pff_alto")
+        self.tamano_memoria_virtual = tamano_memoria_virtual
+        self.tamano_memoria_fisica = tamano_memoria_fisica
+        self.tamano_pagina = tamano_pagina
+        self.num_marcos = tamano_memoria_fisica // tamano_pagina
+        self.pool = PoolMarcos(self.num_marcos)
+        self.politica = politica
+        self.delta = delta
+        self.intervalo = intervalo
+        self.pff_alto = pff_alto
+        self.pff_bajo = pff_bajo
+        self.paso_pff = paso_pff
+
+        self.procesos = {}
+        self.activos = []             # pids en orden de planificación
+        self.suspendidos = deque()    # (pid, demanda al suspenderlo)
+        self.tiempo = 0               # accesos globales
+        self.suspensiones = {}
+        self.tiempo_suspendido = {}
+        self._suspendido_desde = {}
+
+        self.linea_tiempo = []        # (tiempo, {pid: límite}, [suspendidos])
+        self.cambios_asignacion = 0
+        self.episodios = []           # {'inicio', 'fin', 'suspendidos'}
+        self._episodio = None
+
+    def agregar_proceso(self, pid):
+        if pid in self.procesos:
+            raise ValueError(f"El proceso {pid} ya existe")
+        limite = max(1, self.num_marcos // (len(self.activos) + 1))
+        proceso = self.procesos[pid] = TraductorProceso(pid, self.pool, limite, self.tamano_memoria_virtual,
+                                                        self.tamano_memoria_fisica, self.tamano_pagina)
+        if self.politica == 'ws':
+            # con WS el límite es lo garantizado: entre evaluaciones el conjunto residente puede crecer
+            proceso.puede_exceder = self._hay_marcos_sin_reservar
+        self.activos.append(pid)
+        self.suspensiones[pid] = 0
+        self.tiempo_suspendido[pid] = 0
+        return self.procesos[pid]
+
+    # ---------------- Demanda y reparto ----------------
+
+    def _hay_marcos_sin_reservar(self):
+        """True si quedan marcos libres además de los que los procesos activos tienen garantizados."""
+        reservados = 0
+        for pid in self.activos:
+            proceso = self.procesos[pid]
+            reservados += max(0, proceso.limite - proceso.residentes())
+        return self.pool.libres() > reservados
+
+    def _demanda(self, proceso):
+        """(marcos que pide el proceso, su conjunto de trabajo o None)."""
+        if self.politica == 'ws':
+            conjunto = proceso.conjunto_trabajo(self.delta)
+            return max(1, len(conjunto)), conjunto
+        tasa = proceso.fallos_ventana / proceso.accesos_ventana if proceso.accesos_ventana else 0.0
+        paso = max(1, int(proceso.limite * self.paso_pff))
+        if tasa > self.pff_alto:
+            return proceso.limite + paso, None
+        if tasa < self.pff_bajo:
+            return max(1, proceso.limite - paso), None
+        return proceso.limite, None
+
+    def _suspender(self, pid, demanda):
+        proceso = self.procesos[pid]
+        for pagina in list(proceso._paginas_presentes):
+            proceso.desalojar(pagina)
+        proceso.limite = 0
+        self.activos.remove(pid)
+        self.suspendidos.append((pid, demanda))
+        self.suspensiones[pid] += 1
+        self._suspendido_desde[pid] = self.tiempo
+
+    def _reanudar(self, pid, demanda):
+        self.procesos[pid].limite = demanda
+        self.activos.append(pid)
+        self.tiempo_suspendido[pid] += self.tiempo - self._suspendido_desde.pop(pid)
+
+    def _terminar(self, pid):
+        proceso = self.procesos[pid]
+        for pagina in list(proceso._paginas_presentes):
+            proceso.desalojar(pagina)
+        proceso.limite = 0
+        self.activos.remove(pid)
+
+    def evaluar(self):
+        """Recalcula las demandas, suspende si hay hiperpaginación y reanuda si hay lugar."""
+        demandas = {}
+        conjuntos = {}
+        for pid in self.activos:
+            proceso = self.procesos[pid]
+            demandas[pid], conjuntos[pid] = self._demanda(proceso)
+            proceso.fallos_ventana = proceso.accesos_ventana = 0
+
+        hiperpaginacion = sum(demandas.values()) > self.num_marcos
+        suspendidos_ahora = []
+        while sum(demandas.values()) > self.num_marcos and len(demandas) > 1:
+            pid = max(demandas, key=lambda p: (demandas[p], p))
+            self._suspender(pid, demandas.pop(pid))
+            suspendidos_ahora.append(pid)
+        if len(demandas) == 1:
+            # un único proceso activo no puede pedir más que toda la memoria
+            pid = next(iter(demandas))
+            demandas[pid] = min(demandas[pid], self.num_marcos)
+
+        # primero se achican (liberan marcos), después se agrandan
+        for pid, demanda in sorted(demandas.items(), key=lambda d: d[1] - self.procesos[d[0]].limite):
+            proceso = self.procesos[pid]
+            if demanda != proceso.limite:
+                self.cambios_asignacion += 1
+            proceso.recortar(demanda, conjuntos[pid])
+
+        if not hiperpaginacion:
+            libres = self.num_marcos - sum(demandas.values())
+            while self.suspendidos and (self.suspendidos[0][1] <= libres or not self.activos):
+                pid, demanda = self.suspendidos.popleft()
+                demanda = min(demanda, self.num_marcos)
+                self._reanudar(pid, demanda)
+                demandas[pid] = demanda
+                libres -= demanda
+
+        self._registrar_episodio(hiperpaginacion, suspendidos_ahora)
+        self.linea_tiempo.append((self.tiempo, dict(sorted(demandas.items())),
+                                  [pid for pid, _ in self.suspendidos]))
+
+    def _registrar_episodio(self, hiperpaginacion, suspendidos_ahora):
+        if hiperpaginacion:
+            if self._episodio is None:
+                self._episodio = {'inicio': self.tiempo, 'fin': self.tiempo, 'suspendidos': []}
+                self.episodios.append(self._episodio)
+            self._episodio['fin'] = self.tiempo
+            self._episodio['suspendidos'].extend(suspendidos_ahora)
+        else:
+            self._episodio = None
+
+    # ---------------- Simulación ----------------
+
+    def simular(self, trazas, quantum=100):
+        """
+        trazas: {pid: secuencia de direcciones virtuales (int)}. Los procesos
+        activos se turnan de a 'quantum' accesos; cada 'intervalo' accesos
+        globales se llama a evaluar(). Devuelve reporte().
+        """
+        pendientes = {}
+        for pid, traza in trazas.items():
+            self.agregar_proceso(pid)
+            pendientes[pid] = iter(traza)
+        # reparto inicial: partes iguales de los marcos
+        for pid in self.activos:
+            self.procesos[pid].limite = max(1, self.num_marcos // len(self.activos))
+
+        turno = 0
+        proxima_evaluacion = self.intervalo
+        while self.activos or self.suspendidos:
+            if not self.activos:
+                self.evaluar()  # reanuda al primero de los suspendidos
+                continue
+            pid = self.activos[turno % len(self.activos)]
+            proceso = self.procesos[pid]
+            ejecutados = 0
+            for direccion_virtual in pendientes[pid]:
+                proceso.acceder(direccion_virtual)
+                ejecutados += 1
+                if ejecutados == quantum:
+                    break
+            self.tiempo += ejecutados
+            if ejecutados < quantum:
+                self._terminar(pid)
+            else:
+                turno += 1
+            if self.tiempo >= proxima_evaluacion:
+                self.evaluar()
+                proxima_evaluacion = self.tiempo + self.intervalo
+        return self.reporte()
+
+    def reporte(self):
+        por_proceso = {}
+        for pid, proceso in sorted(self.procesos.items()):
+            por_proceso[pid] = {
+                'accesos': proceso.reloj,
+                'fallos_pagina': proceso.fallos_pagina,
+                'tasa_fallos': proceso.fallos_pagina / proceso.reloj if proceso.reloj else 0.0,
+                'sin_marco': proceso.sin_marco,
+                'suspensiones': self.suspensiones[pid],
+                'tiempo_suspendido': self.tiempo_suspendido[pid],
+            }
+        accesos = sum(p['accesos'] for p in por_proceso.values())
+        fallos = sum(p['fallos_pagina'] for p in por_proceso.values())
+        return {
+            'politica': self.politica,
+            'accesos': accesos,
+            'fallos_pagina': fallos,
+            'tasa_fallos': fallos / accesos if accesos else 0.0,
+            'episodios_hiperpaginacion': len(self.episodios),
+            'suspensiones': sum(self.suspensiones.values()),
+            'cambios_asignacion': self.cambios_asignacion,
+            'por_proceso': por_proceso,
+            'episodios': self.episodios,
+            'linea_tiempo': self.linea_tiempo,
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Asignación de marcos por conjunto de trabajo o PFF")
+    parser.add_argument('config', help="archivo de configuración (TAMANO_*)")
+    parser.add_argument('traza', help="traza con líneas PID:DV")
+    parser.add_argument('--politica', choices=POLITICAS, default='ws')
+    parser.add_argument('--delta', type=int, default=1_000, help="ventana del conjunto de trabajo (accesos)")
+    parser.add_argument('--intervalo', type=int, default=1_000, help="accesos entre evaluaciones")
+    parser.add_argument('--pff-alto', type=float, default=0.02)
+    parser.add_argument('--pff-bajo', type=float, default=0.005)
+    parser.add_argument('--quantum', type=int, default=100)
+    parser.add_argument('--linea-tiempo', type=int, default=10, help="mostrar una de cada N evaluaciones (0 = ninguna)")
+    args = parser.parse_args()
+
+    try:
+        configuracion, _, _ = cargar_configuracion_rapida(args.config)
+        trazas = {}
+        for pid, direccion_virtual in leer_traza_con_procesos(args.traza):
+            trazas.setdefault(pid, []).append(direccion_virtual)
+        gestor = GestorConjuntos(configuracion['TAMANO_MEMORIA_VIRTUAL'],
+                                 configuracion['TAMANO_MEMORIA_FISICA'],
+                                 configuracion['TAMANO_PAGINA'],
+                                 politica=args.politica, delta=args.delta, intervalo=args.intervalo,
+                                 pff_alto=args.pff_alto, pff_bajo=args.pff_bajo)
+        reporte = gestor.simular(trazas, args.quantum)
+    except (ValueError, KeyError, OSError) as e:
+        print(f"❌ Error durante la simulación: {e}")
+        sys.exit(1)
+
+    print(f"\nPolítica: {reporte['politica']}  Accesos: {reporte['accesos']}  "
+          f"🔢 Fallos: {reporte['fallos_pagina']} ({reporte['tasa_fallos'] * 100:.2f}%)")
+    print(f"Episodios de hiperpaginación: {reporte['episodios_hiperpaginacion']}  "
+          f"Suspensiones: {reporte['suspensiones']}  Cambios de asignación: {reporte['cambios_asignacion']}")
+    print(f"\n{'pid':>6}{'accesos':>10}{'fallos':>9}{'% fallos':>10}{'suspens.':>10}{'t. susp.':>10}")
+    for pid, datos in reporte['por_proceso'].items():
+        print(f"{pid:>6}{datos['accesos']:>10}{datos['fallos_pagina']:>9}{datos['tasa_fallos'] * 100:>9.2f}%"
+              f"{datos['suspensiones']:>10}{datos['tiempo_suspendido']:>10}")
+    for episodio in reporte['episodios']:
+        print(f"⚠️ Hiperpaginación en t={episodio['inicio']}..{episodio['fin']}, "
+              f"suspendidos: {episodio['suspendidos']}")
+    if args.linea_tiempo:
+        print("\nAsignación de marcos (tiempo: {pid: marcos}, suspendidos):")
+        for tiempo, limites, suspendidos in reporte['linea_tiempo'][::args.linea_tiempo]:
+            print(f"  {tiempo:>9}: {limites}  {suspendidos if suspendidos else ''}")
@@ -0,0 +1,189 @@
+#   Generador de trazas sintéticas de direcciones virtuales.
+#   Cada patrón es un generador que produce direcciones (int) de forma
+#   perezosa, con memoria constante, y reproducible a partir de una semilla.
+#   Con num_accesos=None el generador no termina (útil para mezclas).
+#
+#   Uso:
+#     python generador_trazas.py zipf --accesos 1000000 --config config1.txt --salida traza.txt
+#     python generador_trazas.py secuencial --accesos 100000000 --config config.txt --simular
+
+import sys
+import random
+import argparse
+from itertools import count, islice
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+
+
+def _limitar(generador, num_accesos):
+    return generador if num_accesos is None else islice(generador, num_accesos)
+
+
+def secuencial(num_accesos, tamano_region, tamano_elemento=4, inicio=0):
+    """Recorrido secuencial de la región, elemento por elemento; vuelve al inicio al llegar al final."""
+    def _gen():
+        for i in count():
+            yield inicio + (i * tamano_elemento) % tamano_region
+    return _limitar(_gen(), num_accesos)
+
+
+def con_paso(num_accesos, tamano_region, paso, inicio=0):
+    """Recorrido con paso fijo (p. ej. una columna de una matriz); da la vuelta sobre la región."""
+    def _gen():
+        for i in count():
+            yield inicio + (i * paso) % tamano_region
+    return _limitar(_gen(), num_accesos)
+
+
+def conjunto_ciclico(num_accesos, paginas_conjunto, tamano_pagina, semilla=0, inicio=0):
+    """Bucle sobre un conjunto de trabajo de 'paginas_conjunto' páginas, en orden, con desplazamiento aleatorio."""
+    rng = random.Random(semilla)
+
+    def _gen():
+        for i in count():
+            yield inicio + (i % paginas_conjunto) * tamano_pagina + rng.randrange(tamano_pagina)
+    return _limitar(_gen(), num_accesos)
+
+
+def aleatorio_uniforme(num_accesos, tamano_region, semilla=0, inicio=0):
+    """Direcciones uniformes en [inicio, inicio + tamano_region)."""
+    rng = random.Random(semilla)
+
+    def _gen():
+        while True:
+            yield inicio + rng.randrange(tamano_region)
+    return _limitar(_gen(), num_accesos)
+
+
+def zipf(num_accesos, num_paginas, tamano_pagina, exponente=1.0, semilla=0, inicio=0):
+    """
+    Conjunto caliente con popularidad tipo Zipf: la página de rango k se elige
+    con probabilidad aproximadamente proporcional a 1/k^exponente. Se muestrea
+    invirtiendo la distribución continua equivalente (sin tablas, memoria
+    constante). Los rangos se reparten por el espacio con una permutación
+    multiplicativa, para que las páginas calientes no queden todas juntas.
+    """
+    rng = random.Random(semilla)
+    # multiplicador impar => biyección sobre [0, num_paginas) cuando num_paginas es potencia de 2
+    multiplicador = (rng.randrange(num_paginas) | 1) if num_paginas & (num_paginas - 1) == 0 else 1
+    uno_menos_s = 1.0 - exponente
+
+    def _gen():
+        while True:
+            u = rng.random()
+            if abs(uno_menos_s) < 1e-9:
+                x = num_paginas ** u
+            else:
+                x = ((num_paginas ** uno_menos_s - 1.0) * u + 1.0) ** (1.0 / uno_menos_s)
+            rango = min(int(x) - 1, num_paginas - 1)
+            pagina = (rango * multiplicador) % num_paginas
+            yield inicio + pagina * tamano_pagina + rng.randrange(tamano_pagina)
+    return _limitar(_gen(), num_accesos)
+
+
+def por_fases(*fases):
+    """Encadena patrones finitos: cada uno es una fase del programa."""
+    for fase in fases:
+        yield from fase
+
+
+def mezcla(componentes, num_accesos, semilla=0):
+    """
+    Intercala varios patrones (infinitos) según pesos: componentes es una lista
+    de (peso, generador). Cada acceso se toma del componente elegido al azar.
+    """
+    rng = random.Random(semilla)
+    pesos = [peso for peso, _ in componentes]
+    generadores = [gen for _, gen in componentes]
+
+    def _gen():
+        while True:
+            yield next(rng.choices(generadores, weights=pesos)[0])
+    return _limitar(_gen(), num_accesos)
+
+
+def escribir_direcciones_vi(direcciones, nombre_archivo, configuracion=None, mapas=None):
+    """
+    Escribe la traza en el formato de configuración (sección DIRECCIONES_VI),
+    línea a línea y sin guardar la traza en memoria. Si se da la configuración
+    (TAMANO_*) y los mapeos, se escriben antes para que el archivo sea autocontenido.
+    """
+    with open(nombre_archivo, 'w', buffering=1 << 20) as f:
+        if configuracion:
+            f.write("# --- Configuración de Memoria ---\n")
+            for clave in ('TAMANO_MEMORIA_VIRTUAL', 'TAMANO_MEMORIA_FISICA', 'TAMANO_PAGINA'):
+                f.write(f"{clave}: {configuracion[clave]}\n")
+            f.write("\n# --- Tabla de Páginas ---\nMAPEOS_EMPAQUETADOS:\n")
+            for pagina, entrada in sorted((mapas or {}).items()):
+                f.write(f"{pagina}:{entrada:X}\n")
+            f.write("\n")
+        f.write("DIRECCIONES_VI:\n")
+        f.writelines(f"{dv:X}\n" for dv in direcciones)
+
+
+def alimentar(traductor, direcciones):
+    """Pasa la traza directamente al traductor (sin archivo intermedio). Devuelve contadores."""
+    traducir = traductor.traducir_entero
+    accesos = invalidas = 0
+    for dv in direcciones:
+        accesos += 1
+        if traducir(dv) is None:
+            invalidas += 1
+    return {'accesos': accesos, 'invalidas': invalidas, 'fallos_pagina': traductor.fallos_pagina}
+
+
+def _crear_patron(args, configuracion):
+    region = args.region or configuracion['TAMANO_MEMORIA_VIRTUAL']
+    tamano_pagina = configuracion['TAMANO_PAGINA']
+    if args.patron == 'secuencial':
+        return secuencial(args.accesos, region)
+    if args.patron == 'paso':
+        return con_paso(args.accesos, region, args.paso)
+    if args.patron == 'ciclico':
+        return conjunto_ciclico(args.accesos, args.paginas, tamano_pagina, args.semilla)
+    if args.patron == 'uniforme':
+        return aleatorio_uniforme(args.accesos, region, args.semilla)
+    if args.patron == 'zipf':
+        return zipf(args.accesos, region // tamano_pagina, tamano_pagina, args.exponente, args.semilla)
+    # fases: conjunto cíclico, recorrido secuencial y conjunto caliente, un tercio cada uno
+    tercio = args.accesos // 3
+    return por_fases(conjunto_ciclico(tercio, args.paginas, tamano_pagina, args.semilla),
+                     secuencial(tercio, region),
+                     zipf(args.accesos - 2 * tercio, region // tamano_pagina, tamano_pagina,
+                          args.exponente, args.semilla))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generador de trazas sintéticas")
+    parser.add_argument('patron', choices=['secuencial', 'paso', 'ciclico', 'uniforme', 'zipf', 'fases'])
+    parser.add_argument('--config', default='config1.txt', help="de aquí se toman TAMANO_* y los mapeos")
+    parser.add_argument('--accesos', type=int, default=1000)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--region', type=int, default=0, help="bytes de la región (por defecto toda la memoria virtual)")
+    parser.add_argument('--paso', type=int, default=4096)
+    parser.add_argument('--paginas', type=int, default=8, help="páginas del conjunto de trabajo cíclico")
+    parser.add_argument('--exponente', type=float, default=1.0)
+    parser.add_argument('--salida', help="archivo de salida en formato DIRECCIONES_VI")
+    parser.add_argument('--simular', action='store_true', help="alimentar directamente al traductor")
+    args = parser.parse_args()
+
+    try:
+        configuracion, mapas, _ = cargar_configuracion_rapida(args.config)
+        if args.salida:
+            escribir_direcciones_vi(_crear_patron(args, configuracion), args.salida, configuracion, mapas)
+            print(f"✅ Traza de {args.accesos} accesos escrita en '{args.salida}'.")
+        if args.simular:
+            traductor = TraductorDeDirecciones(
+                configuracion['TAMANO_MEMORIA_VIRTUAL'],
+                configuracion['TAMANO_MEMORIA_FISICA'],
+                configuracion['TAMANO_PAGINA'],
+                mapas,
+                entradas_decodificadas=True
+            )
+            resultado = alimentar(traductor, _crear_patron(args, configuracion))
+            print(f"Accesos: {resultado['accesos']}  Inválidas: {resultado['invalidas']}  "
+                  f"🔢 Fallos de página: {resultado['fallos_pagina']}")
+    except (ValueError, KeyError, OSError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
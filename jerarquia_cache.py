@@ -0,0 +1,247 @@
+#   Simulación de la jerarquía de cachés después de la traducción.
+#   Las direcciones físicas que produce TraductorDeDirecciones pasan por una
+#   TLB y por cachés L1/L2 indexadas físicamente (tamaño, línea y
+#   asociatividad configurables). Con las latencias de cada nivel, del acceso
+#   a memoria y del servicio de un fallo de página se calcula el tiempo medio
+#   de acceso a memoria (AMAT) de la corrida.
+#
+#   Uso:
+#     python jerarquia_cache.py config1.txt --l1 32768:64:8:1 --l2 262144:64:8:10
+
+import sys
+import math
+import argparse
+from collections import OrderedDict
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+
+
+def _es_potencia_de_dos(x):
+    return x > 0 and (x & (x - 1)) == 0
+
+
+class CacheAsociativa:
+    """Caché asociativa por conjuntos, indexada con la dirección física, reemplazo LRU."""
+
+    def __init__(self, nombre, tamano, tamano_linea, asociatividad, latencia):
+        if not _es_potencia_de_dos(tamano_linea):
+            raise ValueError(f"{nombre}: el tamaño de línea debe ser potencia de 2")
+        if asociatividad <= 0 or tamano % (tamano_linea * asociatividad) != 0:
+            raise ValueError(f"{nombre}: el tamaño debe ser múltiplo de línea × asociatividad")
+        num_conjuntos = tamano // (tamano_linea * asociatividad)
+        if not _es_potencia_de_dos(num_conjuntos):
+            raise ValueError(f"{nombre}: el número de conjuntos debe ser potencia de 2")
+
+        self.nombre = nombre
+        self.tamano = tamano
+        self.tamano_linea = tamano_linea
+        self.asociatividad = asociatividad
+        self.latencia = latencia
+        self.num_conjuntos = num_conjuntos
+        self.bits_linea = int(math.log2(tamano_linea))
+        self.mascara_conjunto = num_conjuntos - 1
+
+        # conjunto -> lista de etiquetas, de la menos a la más recientemente usada
+        self.conjuntos = {}
+        self.aciertos = 0
+        self.fallos = 0
+
+    def acceder(self, direccion_fisica):
+        """Devuelve True si la línea estaba en la caché. En un fallo la carga (LRU)."""
+        linea = direccion_fisica >> self.bits_linea
+        indice = linea & self.mascara_conjunto
+        etiquetas = self.conjuntos.get(indice)
+        if etiquetas is None:
+            etiquetas = self.conjuntos[indice] = []
+
+        if linea in etiquetas:
+            self.aciertos += 1
+            if etiquetas[-1] != linea:
+                etiquetas.remove(linea)
+                etiquetas.append(linea)
+            return True
+
+        self.fallos += 1
+        if len(etiquetas) >= self.asociatividad:
+            del etiquetas[0]
+        etiquetas.append(linea)
+        return False
+
+    def tasa_aciertos(self):
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+
+class TLB:
+    """TLB totalmente asociativa con reemplazo LRU: página virtual -> marco."""
+
+    def __init__(self, entradas, latencia):
+        self.entradas = entradas
+        self.latencia = latencia
+        self._mapa = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def consultar(self, pagina):
+        marco = self._mapa.get(pagina)
+        if marco is None:
+            self.fallos += 1
+            return None
+        self._mapa.move_to_end(pagina)
+        self.aciertos += 1
+        return marco
+
+    def insertar(self, pagina, marco):
+        self._mapa[pagina] = marco
+        self._mapa.move_to_end(pagina)
+        if len(self._mapa) > self.entradas:
+            self._mapa.popitem(last=False)
+
+    def invalidar_marco(self, marco):
+        """Quita las traducciones que apuntan a un marco que acaba de reasignarse."""
+        for pagina in [p for p, m in self._mapa.items() if m == marco]:
+            del self._mapa[pagina]
+
+    def tasa_aciertos(self):
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+
+class SimuladorJerarquia:
+    """
+    Envuelve un TraductorDeDirecciones y pasa cada dirección física traducida
+    por la TLB y por los niveles de caché, acumulando el tiempo de cada acceso.
+
+    Latencias (en ns, o en la unidad que se prefiera mientras sea la misma):
+      - TLB: tlb.latencia en cada acceso.
+      - Fallo de TLB: latencia_recorrido (por defecto, un acceso a memoria para leer la entrada).
+      - Fallo de página: latencia_fallo_pagina (servicio del fallo).
+      - Datos: latencia de cada nivel consultado y latencia_memoria si fallan todos.
+    """
+
+    def __init__(self, traductor, niveles, tlb=None, latencia_memoria=100,
+                 latencia_fallo_pagina=1_000_000, latencia_recorrido=None):
+        self.traductor = traductor
+        self.niveles = list(niveles)
+        self.tlb = tlb
+        self.latencia_memoria = latencia_memoria
+        self.latencia_fallo_pagina = latencia_fallo_pagina
+        self.latencia_recorrido = latencia_memoria if latencia_recorrido is None else latencia_recorrido
+
+        self.accesos = 0
+        self.invalidas = 0
+        self.fallos_pagina = 0
+        self.accesos_memoria = 0
+        self.tiempo_total = 0
+
+    def acceder(self, direccion_virtual):
+        """Traduce y simula un acceso. Devuelve la dirección física o None si es inválida."""
+        if not isinstance(direccion_virtual, int):
+            try:
+                direccion_virtual = int(str(direccion_virtual), 16)
+            except ValueError:
+                self.invalidas += 1
+                return None
+
+        tiempo = 0
+        en_tlb = False
+        pagina = direccion_virtual >> self.traductor.bits_desplazamiento
+        if self.tlb is not None:
+            tiempo += self.tlb.latencia
+            en_tlb = self.tlb.consultar(pagina) is not None
+
+        direccion_fisica, hubo_fallo = self.traductor.traducir_silencioso(direccion_virtual)
+        if direccion_fisica is None:
+            self.invalidas += 1
+            return None
+
+        self.accesos += 1
+        if hubo_fallo:
+            self.fallos_pagina += 1
+            tiempo += self.latencia_fallo_pagina
+        if not en_tlb:
+            tiempo += self.latencia_recorrido
+            if self.tlb is not None:
+                marco = direccion_fisica >> self.traductor.bits_desplazamiento
+                if hubo_fallo:
+                    # el marco pudo quitársele a otra página: su traducción ya no vale
+                    self.tlb.invalidar_marco(marco)
+                self.tlb.insertar(pagina, marco)
+
+        for nivel in self.niveles:
+            tiempo += nivel.latencia
+            if nivel.acceder(direccion_fisica):
+                break
+        else:
+            tiempo += self.latencia_memoria
+            self.accesos_memoria += 1
+
+        self.tiempo_total += tiempo
+        return direccion_fisica
+
+    def simular(self, direcciones):
+        for dv in direcciones:
+            self.acceder(dv)
+        return self.reporte()
+
+    def reporte(self):
+        """Resumen de la corrida, incluido el tiempo medio de acceso a memoria (AMAT)."""
+        reporte = {
+            'accesos': self.accesos,
+            'invalidas': self.invalidas,
+            'fallos_pagina': self.fallos_pagina,
+            'tasa_fallos_pagina': self.fallos_pagina / self.accesos if self.accesos else 0.0,
+            'accesos_memoria': self.accesos_memoria,
+            'amat': self.tiempo_total / self.accesos if self.accesos else 0.0,
+        }
+        if self.tlb is not None:
+            reporte['tasa_aciertos_tlb'] = self.tlb.tasa_aciertos()
+        for nivel in self.niveles:
+            reporte[f'tasa_aciertos_{nivel.nombre}'] = nivel.tasa_aciertos()
+        return reporte
+
+
+def _parsear_nivel(nombre, texto):
+    """'tamaño:línea:asociatividad:latencia' -> CacheAsociativa."""
+    tamano, linea, asociatividad, latencia = (int(x) for x in texto.split(':'))
+    return CacheAsociativa(nombre, tamano, linea, asociatividad, latencia)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jerarquía de cachés y AMAT sobre direcciones traducidas")
+    parser.add_argument('config', help="archivo de configuración con la sección DIRECCIONES_VI")
+    parser.add_argument('--l1', default='32768:64:8:1', help="tamaño:línea:asociatividad:latencia")
+    parser.add_argument('--l2', default='262144:64:8:10', help="tamaño:línea:asociatividad:latencia ('' para omitir)")
+    parser.add_argument('--tlb', default='64:1', help="entradas:latencia ('' para omitir)")
+    parser.add_argument('--latencia-memoria', type=int, default=100)
+    parser.add_argument('--latencia-fallo', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    try:
+        configuracion, mapas, direcciones_vi_hex = cargar_configuracion_rapida(args.config)
+        traductor = TraductorDeDirecciones(
+            configuracion['TAMANO_MEMORIA_VIRTUAL'],
+            configuracion['TAMANO_MEMORIA_FISICA'],
+            configuracion['TAMANO_PAGINA'],
+            mapas,
+            entradas_decodificadas=True
+        )
+        niveles = [_parsear_nivel('L1', args.l1)]
+        if args.l2:
+            niveles.append(_parsear_nivel('L2', args.l2))
+        tlb = None
+        if args.tlb:
+            entradas, latencia = (int(x) for x in args.tlb.split(':'))
+            tlb = TLB(entradas, latencia)
+        simulador = SimuladorJerarquia(traductor, niveles, tlb,
+                                       latencia_memoria=args.latencia_memoria,
+                                       latencia_fallo_pagina=args.latencia_fallo)
+        reporte = simulador.simular(direcciones_vi_hex)
+    except (ValueError, KeyError) as e:
+        print(f"❌ Error durante la simulación: {e}")
+        sys.exit(1)
+
+    print("\n--- Jerarquía de memoria ---")
+    for clave, valor in reporte.items():
+        print(f"{clave:<22}{valor:.4f}" if isinstance(valor, float) else f"{clave:<22}{valor}")
@@ -10,25 +10,166 @@
 #   Objetivo:
 #   Implementar un sistema de traducción de direcciones mediante paginación
 #   simulando una Unidad de Gestión de Memoria (MMU).
+#   Uso:
+#     python main.py [--config config1.txt] [--no-mostrar-tabla]
+#     trazador | python main.py --stream            (direcciones por stdin)
+#     python main.py --stream /tmp/traza.fifo       (tubería con nombre)
 
 
 
+import os
+import sys
+import time
+import select
+import argparse
+import contextlib
+
 from traduccion_LFU import TraductorDeDirecciones
-from cargarDatos import cargar_configuracion_desde_archivo
-from colorama import Fore, Style, init
+from cargarDatos import cargar_configuracion_rapida
+
+
+def _leer_bloques(descriptor, intervalo):
+    """
+    Genera los bytes que van llegando al descriptor, o None si pasan
+    'intervalo' segundos sin datos (para vaciar la salida a tiempo).
+    """
+    while True:
+        if os.name == 'posix':
+            listos, _, _ = select.select([descriptor], [], [], intervalo)
+            if not listos:
+                yield None
+                continue
+        datos = os.read(descriptor, 1 << 16)
+        if not datos:
+            return
+        yield datos
+
+
+def traducir_flujo(traductor, ruta='-', tam_bloque=1 << 16, intervalo=0.05):
+    """
+    Modo flujo: lee direcciones virtuales en hexadecimal (separadas por espacios
+    o saltos de línea) de stdin o de una tubería con nombre a medida que llegan,
+    y escribe una línea 'DF:F' por dirección (dirección física en hexadecimal o
+    '-' si es inválida, y bandera de fallo 0/1), el mismo formato que servidor_mmu.py.
+    La salida se junta en bloques y se vacía al llegar a tam_bloque bytes o a
+    los 'intervalo' segundos del primer resultado pendiente.
+    """
+    descriptor = sys.stdin.fileno() if ruta == '-' else os.open(ruta, os.O_RDONLY)
+    salida = sys.stdout.buffer
+    traducir = traductor.traducir_silencioso
+    pendiente = b''
+    bloque = []
+    tam_pendiente = 0
+    desde = None  # momento del primer resultado sin enviar
+
+    def vaciar():
+        nonlocal tam_pendiente, desde
+        if bloque:
+            salida.write(''.join(bloque).encode('ascii'))
+            salida.flush()
+            bloque.clear()
+        tam_pendiente = 0
+        desde = None
+
+    def traducir_lineas(lineas):
+        nonlocal tam_pendiente
+        for linea in lineas:
+            if linea.startswith(b'#'):
+                continue
+            for token in linea.split():
+                try:
+                    direccion_fisica, hubo_fallo = traducir(int(token, 16))
+                except ValueError:
+                    direccion_fisica, hubo_fallo = None, False
+                resultado = (f"{direccion_fisica:X}:{int(hubo_fallo)}\n" if direccion_fisica is not None
+                             else f"-:{int(hubo_fallo)}\n")
+                bloque.append(resultado)
+                tam_pendiente += len(resultado)
+
+    try:
+        for datos in _leer_bloques(descriptor, intervalo):
+            if datos is not None:
+                lineas = (pendiente + datos).split(b'\n')
+                pendiente = lineas.pop()
+                traducir_lineas(lineas)
+                if bloque and desde is None:
+                    desde = time.monotonic()
+            if tam_pendiente >= tam_bloque or (desde is not None and time.monotonic() - desde >= intervalo):
+                vaciar()
+        traducir_lineas([pendiente])
+        vaciar()
+    finally:
+        if ruta != '-':
+            os.close(descriptor)
+
+
+def _crear_traductor(nombre_config):
+    configuracion, mapas, direcciones_vi_hex = cargar_configuracion_rapida(nombre_config)
+    traductor = TraductorDeDirecciones(
+        configuracion['TAMANO_MEMORIA_VIRTUAL'],
+        configuracion['TAMANO_MEMORIA_FISICA'],
+        configuracion['TAMANO_PAGINA'],
+        mapas,
+        entradas_decodificadas=True
+    )
+    return traductor, direcciones_vi_hex
 
-init(autoreset=True)  # Para que los colores se reinicien automáticamente
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Traductor de direcciones virtuales a físicas")
+    parser.add_argument('--config', default='config1.txt')
+    parser.add_argument('--stream', nargs='?', const='-', metavar='RUTA',
+                        help="modo flujo: leer direcciones de stdin ('-') o de una tubería con nombre")
+    parser.add_argument('--bloque', type=int, default=1 << 16, help="bytes de salida por bloque (modo flujo)")
+    parser.add_argument('--intervalo', type=float, default=0.05,
+                        help="segundos máximos que un resultado espera en el bloque (modo flujo)")
+    parser.add_argument('--mostrar-tabla', action=argparse.BooleanOptionalAction, default=True,
+                        help="mostrar paso a paso las tablas de páginas y marcos (con --no-mostrar-tabla "
+                             "sólo se imprime una línea por acceso y no se recorre la tabla)")
+    args = parser.parse_args()
+
+    if args.stream is not None:
+        try:
+            # stdout es sólo para las líneas DF:F: los avisos del parser de configuración van a stderr
+            with contextlib.redirect_stdout(sys.stderr):
+                traductor, _ = _crear_traductor(args.config)
+            traducir_flujo(traductor, args.stream, args.bloque, args.intervalo)
+        except BrokenPipeError:
+            # quien leía la salida terminó: salir sin ruido (y sin que falle el vaciado final de stdout)
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        except (ValueError, KeyError, OSError) as e:
+            print(f"Error durante la ejecución: {e}", file=sys.stderr)
+            sys.exit(1)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    if not args.mostrar_tabla:
+        # sin renderizado: ni colorama ni recorridos de la tabla, el primer acceso sale enseguida
+        try:
+            traductor, direcciones_vi_hex = _crear_traductor(args.config)
+            for i, dv_str in enumerate(direcciones_vi_hex):
+                try:
+                    direccion_fisica, hubo_fallo = traductor.traducir_silencioso(int(dv_str, 16))
+                except ValueError:
+                    direccion_fisica, hubo_fallo = None, False
+                resultado = f"0x{direccion_fisica:X}" if direccion_fisica is not None else "inválida"
+                print(f"ACCESO {i+1} de {len(direcciones_vi_hex)}: DV {dv_str} -> DF {resultado}"
+                      f"{' (fallo de página)' if hubo_fallo else ''}")
+            print(f"🔢 Fallos de página: {traductor.fallos_pagina}")
+        except (ValueError, KeyError) as e:
+            print(f"\nError durante la ejecución: {e}")
+        except KeyboardInterrupt:
+            print("\n\nSimulación interrumpida.")
+        sys.exit(0)
+
+    from colorama import Fore, Style, init
+    init(autoreset=True)  # Para que los colores se reinicien automáticamente
+
     try:
-        configuracion, mapas, direcciones_vi_hex = cargar_configuracion_desde_archivo('config1.txt')
-        
-        traductor = TraductorDeDirecciones(
-            configuracion['TAMANO_MEMORIA_VIRTUAL'],
-            configuracion['TAMANO_MEMORIA_FISICA'],
-            configuracion['TAMANO_PAGINA'],
-            mapas
-        )
+        traductor, direcciones_vi_hex = _crear_traductor(args.config)
+        # El constructor no imprime nada: el estado inicial se muestra explícitamente
+        traductor.imprimir_estado()
         
         print(f"\n{Fore.CYAN + Style.BRIGHT}--- Listo para traducir ---{Style.RESET_ALL}")
         
@@ -0,0 +1,219 @@
+#   Marcos compartidos y copia en escritura (CoW).
+#   Varias páginas pueden apuntar al mismo marco (bibliotecas compartidas,
+#   procesos creados con fork). Cada marco lleva la cuenta de las páginas que
+#   lo usan; una escritura sobre una página marcada CoW cuyo marco está
+#   compartido provoca un fallo CoW que le asigna un marco privado.
+#
+#   Las páginas CoW se llevan en un conjunto aparte (paginas_cow), no en un bit
+#   de la entrada empaquetada: los bits de control de la configuración se
+#   conservan igual que en TraductorDeDirecciones.
+
+from traduccion_LFU import TraductorDeDirecciones
+
+
+class TraductorCompartido(TraductorDeDirecciones):
+    """
+    TraductorDeDirecciones con mapeos compartidos y copia en escritura.
+
+    paginas_por_marco guarda, para cada marco en uso, el conjunto de páginas
+    presentes que lo mapean; su tamaño es la cuenta de referencias del marco.
+    Al reemplazar un marco compartido se desalojan todas las páginas que lo usan.
+    """
+
+    def __init__(self, tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                 entradas_decodificadas=False):
+        super().__init__(tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                         entradas_decodificadas)
+
+        # páginas presentes de sólo lectura compartida (CoW)
+        self.paginas_cow = set()
+
+        # marco -> páginas presentes que lo mapean (la cuenta de referencias es len())
+        self.paginas_por_marco = {}
+        for pagina in self._paginas_presentes:
+            marco = self.tabla_de_paginas[pagina] & self.MASK_MARCO
+            self.paginas_por_marco.setdefault(marco, set()).add(pagina)
+
+        # estadísticas de compartición
+        self.escrituras = 0
+        self.fallos_cow = 0
+        self.cow_sin_copia = 0  # escrituras CoW cuyo marco ya no estaba compartido
+        self.marcos_compartidos_desalojados = 0
+
+    def referencias(self, marco):
+        """Cantidad de páginas presentes que mapean el marco."""
+        return len(self.paginas_por_marco.get(marco, ()))
+
+    # ---------------- Mapeos compartidos ----------------
+
+    def _desmapear_pagina(self, pagina):
+        """Quita una página presente de su marco; si el marco queda sin referencias, lo libera."""
+        entrada = self.tabla_de_paginas.get(pagina, 0)
+        if not entrada & self.MASK_PRESENTE:
+            return
+        marco = entrada & self.MASK_MARCO
+        self.tabla_de_paginas[pagina] = entrada & ~self.MASK_PRESENTE
+        self.paginas_cow.discard(pagina)
+        self.frecuencias_uso[pagina] = 0
+        self._paginas_presentes.discard(pagina)
+        paginas = self.paginas_por_marco.get(marco)
+        if paginas is not None:
+            paginas.discard(pagina)
+            if not paginas:
+                del self.paginas_por_marco[marco]
+                self._liberar_marco(marco)
+
+    def compartir(self, pagina_origen, pagina_destino, copia_en_escritura=True):
+        """
+        Hace que pagina_destino mapee el mismo marco que pagina_origen (que debe
+        estar presente). Con copia_en_escritura ambas quedan marcadas CoW; sin
+        ella el marco se comparte también para escritura (memoria compartida).
+        """
+        for pagina in (pagina_origen, pagina_destino):
+            if not (0 <= pagina < self.num_paginas):
+                raise ValueError(f"Página {pagina} inválida (0..{self.num_paginas-1})")
+        if pagina_origen == pagina_destino:
+            raise ValueError("La página origen y destino deben ser distintas")
+        entrada_origen = self.tabla_de_paginas.get(pagina_origen, 0)
+        if not entrada_origen & self.MASK_PRESENTE:
+            raise ValueError(f"La página origen {pagina_origen} no está presente en memoria")
+
+        self._desmapear_pagina(pagina_destino)
+        marco = entrada_origen & self.MASK_MARCO
+
+        if copia_en_escritura:
+            self.paginas_cow.add(pagina_origen)
+            self.paginas_cow.add(pagina_destino)
+        control_destino = self.tabla_de_paginas.get(pagina_destino, 0) & self.MASK_CONTROL
+        self.tabla_de_paginas[pagina_destino] = control_destino | marco | self.MASK_PRESENTE
+        self.frecuencias_uso[pagina_destino] = 0
+        self._paginas_presentes.add(pagina_destino)
+        self.paginas_por_marco[marco].add(pagina_destino)
+
+    def bifurcar(self, pagina_inicio, num_paginas, pagina_destino, copia_en_escritura=True):
+        """
+        Simula un fork: las páginas presentes de [pagina_inicio, pagina_inicio + num_paginas)
+        se comparten (CoW) con la región que empieza en pagina_destino.
+        Devuelve cuántas páginas quedaron compartidas.
+        """
+        compartidas = 0
+        for desplazamiento in range(num_paginas):
+            origen = pagina_inicio + desplazamiento
+            if self.tabla_de_paginas.get(origen, 0) & self.MASK_PRESENTE:
+                self.compartir(origen, pagina_destino + desplazamiento, copia_en_escritura)
+                compartidas += 1
+        return compartidas
+
+    # ---------------- Fallos y reemplazo ----------------
+
+    def _reclamar_marco_LFU(self, excluir=(), verbose=False):
+        """
+        Libera el marco de la página menos usada (sin contar las páginas de 'excluir') y lo
+        devuelve todavía marcado como ocupado. Si el marco estaba compartido se
+        desalojan todas las páginas que lo mapean.
+        """
+        candidatas = self._paginas_presentes - set(excluir) if excluir else self._paginas_presentes
+        if not candidatas:
+            return None
+
+        frecuencias = self.frecuencias_uso
+        pagina_LFU = min(candidatas, key=lambda p: (frecuencias.get(p, 0), p))
+        marco = self.tabla_de_paginas[pagina_LFU] & self.MASK_MARCO
+        paginas = self.paginas_por_marco.pop(marco, {pagina_LFU})
+        if len(paginas) > 1:
+            self.marcos_compartidos_desalojados += 1
+        if verbose:
+            print(f"\n🔁 Reemplazo LFU: Página {pagina_LFU} (uso={frecuencias.get(pagina_LFU, 0)}) "
+                  f"→ se libera el Marco {marco} (páginas que lo usaban: {sorted(paginas)}).\n")
+
+        for pagina in paginas:
+            self.tabla_de_paginas[pagina] &= ~self.MASK_PRESENTE
+            self.paginas_cow.discard(pagina)
+            frecuencias[pagina] = 0
+            self._paginas_presentes.discard(pagina)
+        return marco
+
+    def _reemplazar_pagina_LFU(self, pagina_faltante, verbose=True):
+        """Reemplazo LFU que tiene en cuenta los marcos compartidos."""
+        marco = self._reclamar_marco_LFU(verbose=verbose)
+        if marco is None:
+            return None
+        control_prev = self.tabla_de_paginas.get(pagina_faltante, 0) & self.MASK_CONTROL
+        self.tabla_de_paginas[pagina_faltante] = control_prev | (marco & self.MASK_MARCO) | self.MASK_PRESENTE
+        self._paginas_presentes.add(pagina_faltante)
+        self.frecuencias_uso[pagina_faltante] = 1
+        return marco
+
+    def _atender_fallo(self, numero_pagina, entrada_packed, verbose=True):
+        # una página cargada por un fallo es siempre privada
+        self.paginas_cow.discard(numero_pagina)
+        marco = super()._atender_fallo(numero_pagina, entrada_packed, verbose)
+        if marco is not None:
+            self.paginas_por_marco[marco] = {numero_pagina}
+        return marco
+
+    # ---------------- Accesos con escritura ----------------
+
+    def acceder(self, direccion_virtual, escritura=False):
+        """
+        Traduce un acceso (int). En una escritura sobre una página CoW con el
+        marco compartido se copia la página a un marco privado (fallo CoW).
+        Devuelve la dirección física o None si la dirección es inválida.
+        """
+        direccion_fisica = self.traducir_entero(direccion_virtual)
+        if direccion_fisica is None or not escritura:
+            return direccion_fisica
+
+        self.escrituras += 1
+        numero_pagina = direccion_virtual >> self.bits_desplazamiento
+        if numero_pagina not in self.paginas_cow:
+            return direccion_fisica
+
+        entrada = self.tabla_de_paginas[numero_pagina]
+        marco = entrada & self.MASK_MARCO
+        if self.referencias(marco) <= 1:
+            # nadie más usa el marco: basta con quitar la marca CoW
+            self.paginas_cow.discard(numero_pagina)
+            self.cow_sin_copia += 1
+            return direccion_fisica
+
+        # fallo CoW: copiar a un marco privado
+        self.fallos_cow += 1
+        marco_nuevo = self._encontrar_marco_libre()
+        if marco_nuevo is not None:
+            self.marcos_ocupados.add(marco_nuevo)
+        else:
+            # no se puede reclamar el marco que se está copiando
+            marco_nuevo = self._reclamar_marco_LFU(excluir=self.paginas_por_marco[marco])
+            if marco_nuevo is None:
+                return None
+
+        self.paginas_por_marco[marco].discard(numero_pagina)
+        self.paginas_por_marco[marco_nuevo] = {numero_pagina}
+        self.paginas_cow.discard(numero_pagina)
+        self.tabla_de_paginas[numero_pagina] = (entrada & ~self.MASK_MARCO) | marco_nuevo
+        return (marco_nuevo << self.bits_desplazamiento) | (direccion_virtual & self.mascara_desplazamiento)
+
+    def simular(self, accesos):
+        """Aplica una secuencia de (direccion_virtual, es_escritura) y devuelve reporte_compartido()."""
+        acceder = self.acceder
+        for direccion_virtual, escritura in accesos:
+            acceder(direccion_virtual, escritura)
+        return self.reporte_compartido()
+
+    def reporte_compartido(self):
+        """Memoria ahorrada por compartir marcos y tasa de fallos CoW."""
+        paginas_mapeadas = sum(len(p) for p in self.paginas_por_marco.values())
+        marcos_en_uso = len(self.paginas_por_marco)
+        return {
+            'paginas_mapeadas': paginas_mapeadas,
+            'marcos_en_uso': marcos_en_uso,
+            'marcos_compartidos': sum(1 for p in self.paginas_por_marco.values() if len(p) > 1),
+            'memoria_ahorrada_bytes': (paginas_mapeadas - marcos_en_uso) * self.tamano_pagina,
+            'escrituras': self.escrituras,
+            'fallos_cow': self.fallos_cow,
+            'cow_sin_copia': self.cow_sin_copia,
+            'tasa_fallos_cow': self.fallos_cow / self.escrituras if self.escrituras else 0.0,
+            'fallos_pagina': self.fallos_pagina,
+            'marcos_compartidos_desalojados': self.marcos_compartidos_desalojados,
+        }
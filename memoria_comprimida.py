@@ -0,0 +1,221 @@
+#   Capa de memoria comprimida entre los marcos y el swap (al estilo zswap).
+#   Una página desalojada se comprime y se guarda en un pool acotado; si no
+#   cabe, las más antiguas del pool bajan al swap simulado. Un fallo sobre una
+#   página que está en el pool se atiende descomprimiéndola (latencia_pool),
+#   mucho más barato que leerla del swap (latencia_swap).
+#
+#   Las páginas del pool nunca se vuelven a referenciar mientras están ahí (al
+#   usarse salen del pool), así que el orden de inserción es a la vez FIFO y LRU.
+#
+#   El pool no cambia qué páginas desaloja LFU, así que la misma corrida da
+#   también el I/O de swap que habría sin pool: cada desalojo sería una
+#   escritura y cada fallo sobre una página ya desalojada, una lectura.
+#
+#   Uso:
+#     python memoria_comprimida.py config1.txt --pool 65536 --razon 3.0
+
+import sys
+import math
+import random
+import argparse
+from collections import OrderedDict
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+
+
+def modelo_aleatorio(tamano_pagina, razon_min=2.0, razon_max=4.0, fraccion_incompresible=0.0, semilla=0):
+    """
+    Modelo de compresión para TraductorComprimido: cada página recibe una razón
+    uniforme en [razon_min, razon_max], fija para esa página y semilla. Una
+    fracción de páginas puede ser incompresible (ocupa la página entera).
+    Devuelve una función pagina -> bytes comprimidos.
+    """
+    if not (0 < razon_min <= razon_max):
+        raise ValueError(f"Se necesita 0 < razon_min <= razon_max (se recibió [{razon_min}, {razon_max}])")
+    if not (0 <= fraccion_incompresible <= 1):
+        raise ValueError("fraccion_incompresible debe estar entre 0 y 1")
+
+    def _modelo(pagina):
+        rng = random.Random(semilla * 1_000_003 + pagina)
+        if rng.random() < fraccion_incompresible:
+            return tamano_pagina
+        return math.ceil(tamano_pagina / rng.uniform(razon_min, razon_max))
+    return _modelo
+
+
+class TraductorComprimido(TraductorDeDirecciones):
+    """
+    TraductorDeDirecciones con un pool de páginas comprimidas de tamano_pool
+    bytes antes del swap. tamano_pool=0 equivale a no tener pool.
+
+    razon_compresion es un número (bytes comprimidos = tamaño de página / razón)
+    o una función pagina -> bytes comprimidos (ver modelo_aleatorio). Las páginas
+    que no comprimen por debajo del tamaño de página van directo al swap.
+
+    Costos (en la misma unidad): latencia_pool por fallo atendido desde el pool,
+    latencia_swap por fallo atendido desde el swap y latencia_compresion por
+    página guardada en el pool.
+    """
+
+    def __init__(self, tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                 entradas_decodificadas=False, tamano_pool=0, razon_compresion=3.0,
+                 latencia_pool=5_000, latencia_swap=1_000_000, latencia_compresion=2_000):
+        super().__init__(tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                         entradas_decodificadas)
+        if tamano_pool < 0:
+            raise ValueError("tamano_pool debe ser >= 0")
+        if callable(razon_compresion):
+            self._tamano_comprimido = razon_compresion
+        elif razon_compresion > 0:
+            self._tamano_comprimido = lambda pagina: math.ceil(tamano_pagina / razon_compresion)
+        else:
+            raise ValueError("razon_compresion debe ser > 0 o una función")
+
+        self.tamano_pool = tamano_pool
+        self.latencia_pool = latencia_pool
+        self.latencia_swap = latencia_swap
+        self.latencia_compresion = latencia_compresion
+
+        # página -> bytes comprimidos, de la más antigua a la más reciente
+        self.pool = OrderedDict()
+        self.ocupacion_pool = 0
+        self.en_swap = set()
+
+        # estadísticas
+        self.desalojos = 0
+        self.guardadas_pool = 0
+        self.rechazadas_pool = 0   # no comprimían lo suficiente
+        self.expulsadas_pool = 0   # bajaron del pool al swap por falta de espacio
+        self.aciertos_pool = 0
+        self.escrituras_swap = 0
+        self.lecturas_swap = 0
+        self.fallos_primer_acceso = 0
+        self.ocupacion_maxima_pool = 0
+        self.tiempo_fallos = 0
+
+    # ---------------- Pool ----------------
+
+    def _escribir_swap(self, pagina):
+        self.en_swap.add(pagina)
+        self.escrituras_swap += 1
+
+    def _guardar_desalojada(self, pagina):
+        """Comprime la página desalojada en el pool o, si no se puede, la escribe al swap."""
+        self.desalojos += 1
+        tamano = self._tamano_comprimido(pagina)
+        if tamano >= self.tamano_pagina or tamano > self.tamano_pool:
+            self.rechazadas_pool += 1
+            self._escribir_swap(pagina)
+            return
+
+        # hacer lugar bajando al swap las más antiguas
+        while self.ocupacion_pool + tamano > self.tamano_pool:
+            antigua, tamano_antigua = self.pool.popitem(last=False)
+            self.ocupacion_pool -= tamano_antigua
+            self.expulsadas_pool += 1
+            self._escribir_swap(antigua)
+
+        self.pool[pagina] = tamano
+        self.ocupacion_pool += tamano
+        self.guardadas_pool += 1
+        self.tiempo_fallos += self.latencia_compresion
+        if self.ocupacion_pool > self.ocupacion_maxima_pool:
+            self.ocupacion_maxima_pool = self.ocupacion_pool
+
+    def _reemplazar_victima(self, pagina_LFU, pagina_faltante, verbose=True):
+        marco = super()._reemplazar_victima(pagina_LFU, pagina_faltante, verbose)
+        self._guardar_desalojada(pagina_LFU)
+        return marco
+
+    def _atender_fallo(self, numero_pagina, entrada_packed, verbose=True):
+        # primero se saca la página de donde esté: libera lugar en el pool para la víctima
+        tamano = self.pool.pop(numero_pagina, None)
+        if tamano is not None:
+            self.ocupacion_pool -= tamano
+            self.aciertos_pool += 1
+            self.tiempo_fallos += self.latencia_pool
+            if verbose:
+                print(f"   🗜️  Página {numero_pagina} recuperada del pool comprimido.")
+        elif numero_pagina in self.en_swap:
+            self.en_swap.discard(numero_pagina)
+            self.lecturas_swap += 1
+            self.tiempo_fallos += self.latencia_swap
+            if verbose:
+                print(f"   💾 Página {numero_pagina} leída del swap.")
+        else:
+            self.fallos_primer_acceso += 1
+        return super()._atender_fallo(numero_pagina, entrada_packed, verbose)
+
+    # ---------------- Reporte ----------------
+
+    def reporte_comprimido(self):
+        """
+        Ocupación y tasa de aciertos del pool, I/O de swap con y sin pool, y
+        tiempo de servicio de fallos con y sin pool (sin pool, cada
+        fallo sobre una página ya desalojada es una lectura del swap).
+        """
+        refallos = self.aciertos_pool + self.lecturas_swap
+        io_swap = self.escrituras_swap + self.lecturas_swap
+        io_sin_pool = self.desalojos + refallos
+        return {
+            'fallos_pagina': self.fallos_pagina,
+            'fallos_primer_acceso': self.fallos_primer_acceso,
+            'desalojos': self.desalojos,
+            'paginas_en_pool': len(self.pool),
+            'ocupacion_pool_bytes': self.ocupacion_pool,
+            'ocupacion_maxima_pool_bytes': self.ocupacion_maxima_pool,
+            'uso_pool': self.ocupacion_pool / self.tamano_pool if self.tamano_pool else 0.0,
+            'guardadas_pool': self.guardadas_pool,
+            'rechazadas_pool': self.rechazadas_pool,
+            'expulsadas_pool': self.expulsadas_pool,
+            'aciertos_pool': self.aciertos_pool,
+            'tasa_aciertos_pool': self.aciertos_pool / refallos if refallos else 0.0,
+            'escrituras_swap': self.escrituras_swap,
+            'lecturas_swap': self.lecturas_swap,
+            'io_swap_sin_pool': io_sin_pool,
+            'reduccion_io_swap': 1 - io_swap / io_sin_pool if io_sin_pool else 0.0,
+            'tiempo_fallos': self.tiempo_fallos,
+            'tiempo_fallos_sin_pool': refallos * self.latencia_swap,
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pool de memoria comprimida antes del swap")
+    parser.add_argument('config', help="archivo de configuración con la sección DIRECCIONES_VI")
+    parser.add_argument('--pool', type=int, default=65536, help="capacidad del pool en bytes (0 = sin pool)")
+    parser.add_argument('--razon', type=float, default=3.0, help="razón de compresión media")
+    parser.add_argument('--dispersion', type=float, default=0.0,
+                        help="razones uniformes en [razon - dispersion, razon + dispersion] por página")
+    parser.add_argument('--incompresibles', type=float, default=0.0, help="fracción de páginas incompresibles")
+    parser.add_argument('--latencia-pool', type=int, default=5_000)
+    parser.add_argument('--latencia-swap', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    try:
+        configuracion, mapas, direcciones_vi_hex = cargar_configuracion_rapida(args.config)
+        razon = args.razon
+        if args.dispersion or args.incompresibles:
+            razon = modelo_aleatorio(configuracion['TAMANO_PAGINA'], args.razon - args.dispersion,
+                                     args.razon + args.dispersion, args.incompresibles)
+        traductor = TraductorComprimido(
+            configuracion['TAMANO_MEMORIA_VIRTUAL'],
+            configuracion['TAMANO_MEMORIA_FISICA'],
+            configuracion['TAMANO_PAGINA'],
+            mapas,
+            entradas_decodificadas=True,
+            tamano_pool=args.pool,
+            razon_compresion=razon,
+            latencia_pool=args.latencia_pool,
+            latencia_swap=args.latencia_swap
+        )
+        for dv in direcciones_vi_hex:
+            traductor.traducir_silencioso(dv)
+        reporte = traductor.reporte_comprimido()
+    except (ValueError, KeyError) as e:
+        print(f"❌ Error durante la simulación: {e}")
+        sys.exit(1)
+
+    print("\n--- Memoria comprimida ---")
+    for clave, valor in reporte.items():
+        print(f"{clave:<30}{valor:.4f}" if isinstance(valor, float) else f"{clave:<30}{valor}")
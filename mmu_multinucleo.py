@@ -0,0 +1,341 @@
+#   MMU multinúcleo: varios núcleos simulados, cada uno con su TLB privada,
+#   traducen contra la misma tabla de páginas desde hilos distintos.
+#
+#   Candados (siempre en este orden, nunca al revés):
+#     1. _candado_asignador: fallos de página y reemplazo (marcos_ocupados,
+#        _paginas_presentes, fallos_pagina). Sólo lo toma quien falla.
+#     2. franjas de páginas: la página p se protege con _franjas[p % num_franjas];
+#        un acierto sólo toma la franja de su página, así los aciertos de
+#        páginas distintas no se bloquean entre sí.
+#     3. candado de cada TLB.
+#
+#   Cada desalojo borra la traducción de la víctima en todas las TLB que la
+#   tengan (derribo de TLB o "shootdown"). El derribo se hace con la franja
+#   de la víctima tomada, para que ningún núcleo vuelva a cargar en su TLB la
+#   traducción vieja. Su costo en ciclos se le cobra al núcleo que desaloja
+#   (costo_derribo + costo_ipi por cada núcleo interrumpido) y a cada núcleo
+#   interrumpido (costo_ipi).
+#
+#   El tiempo es simulado (ciclos por núcleo): el paralelismo real de los
+#   hilos de Python no influye en el reporte.
+#
+#   Uso:
+#     python mmu_multinucleo.py --config config1.txt --nucleos 1 2 4 8
+#     python mmu_multinucleo.py --config config1.txt --traza traza.txt   (líneas NUCLEO:DV)
+
+import sys
+import argparse
+import threading
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+from jerarquia_cache import TLB
+from simulacion_paralela import leer_traza_con_procesos
+import generador_trazas
+
+
+class TLBNucleo(TLB):
+    """TLB privada de un núcleo. Su candado lo toma quien la use (ver el orden de candados)."""
+
+    def __init__(self, entradas, latencia):
+        super().__init__(entradas, latencia)
+        self.candado = threading.Lock()
+
+    def invalidar_pagina(self, pagina):
+        """Quita la traducción de la página. Devuelve True si estaba."""
+        return self._mapa.pop(pagina, None) is not None
+
+
+class EstadisticasNucleo:
+    """Contadores de un núcleo. Sólo los escribe el hilo del núcleo, salvo ciclos_interrupcion."""
+
+    def __init__(self):
+        self.accesos = 0
+        self.invalidas = 0
+        self.fallos_pagina = 0
+        self.traducciones_obsoletas = 0  # aciertos de TLB que el derribo invalidó a mitad del acceso
+        self.derribos_iniciados = 0
+        self.ciclos = 0
+        # ciclos de atender IPI de otros núcleos (se escriben con el candado de la TLB del núcleo)
+        self.ipis_recibidas = 0
+        self.ciclos_interrupcion = 0
+
+
+class MMUMultinucleo(TraductorDeDirecciones):
+    """
+    TraductorDeDirecciones compartido por num_nucleos núcleos. Los métodos
+    seguros entre hilos son acceder() y ejecutar(); el resto de la API del
+    traductor (traducir, imprimir_*) sigue siendo de un solo hilo.
+
+    Latencias en ciclos: latencia_tlb en cada acceso, latencia_recorrido en
+    cada fallo de TLB y latencia_fallo en cada fallo de página.
+    """
+
+    def __init__(self, tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                 entradas_decodificadas=False, num_nucleos=4, entradas_tlb=64, num_franjas=64,
+                 latencia_tlb=1, latencia_recorrido=100, latencia_fallo=10_000,
+                 costo_derribo=1_000, costo_ipi=500):
+        super().__init__(tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                         entradas_decodificadas)
+        if num_nucleos <= 0 or num_franjas <= 0:
+            raise ValueError("num_nucleos y num_franjas deben ser > 0")
+
+        self.num_nucleos = num_nucleos
+        self.tlbs = [TLBNucleo(entradas_tlb, latencia_tlb) for _ in range(num_nucleos)]
+        self.estadisticas = [EstadisticasNucleo() for _ in range(num_nucleos)]
+        self.latencia_recorrido = latencia_recorrido
+        self.latencia_fallo = latencia_fallo
+        self.costo_derribo = costo_derribo
+        self.costo_ipi = costo_ipi
+
+        self._candado_asignador = threading.Lock()
+        self._franjas = [threading.Lock() for _ in range(num_franjas)]
+        # núcleo que está atendiendo un fallo (sólo válido con _candado_asignador tomado)
+        self._nucleo_en_fallo = None
+
+        # contadores globales (se escriben con _candado_asignador tomado)
+        self.desalojos = 0
+        self.derribos_tlb = 0
+        self.ipis = 0
+        self.ciclos_derribo = 0
+
+    def _franja(self, pagina):
+        return self._franjas[pagina % len(self._franjas)]
+
+    # ---------------- Reemplazo con derribo de TLB ----------------
+
+    def _reemplazar_victima(self, pagina_LFU, pagina_faltante, verbose=True):
+        # ya tenemos _candado_asignador y la franja de pagina_faltante
+        candado = self._franja(pagina_LFU)
+        propia = candado is self._franja(pagina_faltante)
+        if not propia:
+            candado.acquire()
+        try:
+            marco = super()._reemplazar_victima(pagina_LFU, pagina_faltante, verbose)
+            self.desalojos += 1
+            self._derribar(pagina_LFU)
+            return marco
+        finally:
+            if not propia:
+                candado.release()
+
+    def _derribar(self, pagina):
+        """Invalida la página en todas las TLB y cobra el derribo al núcleo que desaloja."""
+        iniciador = self._nucleo_en_fallo
+        interrumpidos = 0
+        for nucleo, tlb in enumerate(self.tlbs):
+            with tlb.candado:
+                if not tlb.invalidar_pagina(pagina) or nucleo == iniciador:
+                    continue
+                estadisticas = self.estadisticas[nucleo]
+                estadisticas.ipis_recibidas += 1
+                estadisticas.ciclos_interrupcion += self.costo_ipi
+            interrumpidos += 1
+
+        # si ningún otro núcleo tenía la traducción basta con la invalidación local
+        if interrumpidos:
+            costo = self.costo_derribo + self.costo_ipi * interrumpidos
+            self.derribos_tlb += 1
+            self.ipis += interrumpidos
+            self.ciclos_derribo += costo
+            if iniciador is not None:
+                self.estadisticas[iniciador].derribos_iniciados += 1
+                self.estadisticas[iniciador].ciclos += costo
+
+    # ---------------- Accesos ----------------
+
+    def acceder(self, nucleo, direccion_virtual):
+        """
+        Traduce un acceso (int) del núcleo indicado. Seguro entre hilos.
+        Devuelve la dirección física o None si la dirección es inválida.
+        """
+        estadisticas = self.estadisticas[nucleo]
+        tlb = self.tlbs[nucleo]
+        numero_pagina = direccion_virtual >> self.bits_desplazamiento
+        desplazamiento = direccion_virtual & self.mascara_desplazamiento
+        estadisticas.accesos += 1
+        estadisticas.ciclos += tlb.latencia
+
+        with tlb.candado:
+            marco = tlb.consultar(numero_pagina)
+        candado = self._franja(numero_pagina)
+
+        if marco is not None:
+            with candado:
+                entrada = self.tabla_de_paginas.get(numero_pagina, 0)
+                if entrada & self.MASK_PRESENTE and entrada & self.MASK_MARCO == marco:
+                    self.frecuencias_uso[numero_pagina] = self.frecuencias_uso.get(numero_pagina, 0) + 1
+                    return (marco << self.bits_desplazamiento) | desplazamiento
+            # otro núcleo desalojó la página entre la consulta y ahora: cuenta como fallo de TLB
+            estadisticas.traducciones_obsoletas += 1
+            with tlb.candado:
+                tlb.aciertos -= 1
+                tlb.fallos += 1
+
+        estadisticas.ciclos += self.latencia_recorrido
+        if not (0 <= numero_pagina < self.num_paginas):
+            estadisticas.invalidas += 1
+            return None
+
+        # recorrido de la tabla: sólo la franja de la página
+        with candado:
+            marco = self._consultar_tabla(numero_pagina, tlb)
+        if marco is not None:
+            return (marco << self.bits_desplazamiento) | desplazamiento
+
+        # fallo de página: asignador y luego la franja (otro núcleo pudo cargarla mientras tanto)
+        with self._candado_asignador, candado:
+            marco = self._consultar_tabla(numero_pagina, tlb)
+            if marco is None:
+                self.fallos_pagina += 1
+                estadisticas.fallos_pagina += 1
+                estadisticas.ciclos += self.latencia_fallo
+                self._nucleo_en_fallo = nucleo
+                marco = self._atender_fallo(numero_pagina, self.tabla_de_paginas.get(numero_pagina, 0),
+                                            verbose=False)
+                self._nucleo_en_fallo = None
+                if marco is None:
+                    return None
+                with tlb.candado:
+                    tlb.insertar(numero_pagina, marco)
+        return (marco << self.bits_desplazamiento) | desplazamiento
+
+    def _consultar_tabla(self, numero_pagina, tlb):
+        """Con la franja de la página tomada: si está presente suma uso, la carga en la TLB y devuelve el marco."""
+        entrada = self.tabla_de_paginas.get(numero_pagina, 0)
+        if not entrada & self.MASK_PRESENTE:
+            return None
+        marco = entrada & self.MASK_MARCO
+        self.frecuencias_uso[numero_pagina] = self.frecuencias_uso.get(numero_pagina, 0) + 1
+        # se inserta antes de soltar la franja: un derribo posterior la verá
+        with tlb.candado:
+            tlb.insertar(numero_pagina, marco)
+        return marco
+
+    def _reproducir(self, nucleo, direcciones):
+        acceder = self.acceder
+        for direccion_virtual in direcciones:
+            acceder(nucleo, direccion_virtual)
+
+    def ejecutar(self, trazas):
+        """
+        Reproduce trazas[i] en el núcleo i, un hilo por núcleo, y devuelve reporte().
+        trazas es una lista de secuencias de direcciones (int), a lo sumo una por núcleo.
+        """
+        if len(trazas) > self.num_nucleos:
+            raise ValueError(f"Hay {len(trazas)} trazas para {self.num_nucleos} núcleos")
+        hilos = [threading.Thread(target=self._reproducir, args=(nucleo, traza), name=f"nucleo-{nucleo}")
+                 for nucleo, traza in enumerate(trazas)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        return self.reporte()
+
+    def reporte(self):
+        """
+        Totales y contadores por núcleo. tiempo_simulado es el del núcleo más
+        lento; accesos_por_ciclo permite comparar la escalabilidad entre
+        distintas cantidades de núcleos.
+        """
+        por_nucleo = []
+        for nucleo, (estadisticas, tlb) in enumerate(zip(self.estadisticas, self.tlbs)):
+            por_nucleo.append({
+                'nucleo': nucleo,
+                'accesos': estadisticas.accesos,
+                'fallos_pagina': estadisticas.fallos_pagina,
+                'tasa_aciertos_tlb': tlb.tasa_aciertos(),
+                'derribos_iniciados': estadisticas.derribos_iniciados,
+                'ipis_recibidas': estadisticas.ipis_recibidas,
+                'ciclos': estadisticas.ciclos + estadisticas.ciclos_interrupcion,
+            })
+
+        accesos = sum(e.accesos for e in self.estadisticas)
+        aciertos_tlb = sum(t.aciertos for t in self.tlbs)
+        consultas_tlb = aciertos_tlb + sum(t.fallos for t in self.tlbs)
+        ciclos_totales = sum(n['ciclos'] for n in por_nucleo)
+        tiempo_simulado = max((n['ciclos'] for n in por_nucleo), default=0)
+        # lo que cuesta cada derribo al iniciador más lo que cuestan las IPI en los interrumpidos
+        ciclos_por_derribos = self.ciclos_derribo + self.costo_ipi * self.ipis
+        return {
+            'nucleos': self.num_nucleos,
+            'accesos': accesos,
+            'invalidas': sum(e.invalidas for e in self.estadisticas),
+            'fallos_pagina': self.fallos_pagina,
+            'desalojos': self.desalojos,
+            'derribos_tlb': self.derribos_tlb,
+            'ipis': self.ipis,
+            'traducciones_obsoletas': sum(e.traducciones_obsoletas for e in self.estadisticas),
+            'tasa_aciertos_tlb': aciertos_tlb / consultas_tlb if consultas_tlb else 0.0,
+            'ciclos_derribo': ciclos_por_derribos,
+            'fraccion_ciclos_derribo': ciclos_por_derribos / ciclos_totales if ciclos_totales else 0.0,
+            'tiempo_simulado': tiempo_simulado,
+            'accesos_por_ciclo': accesos / tiempo_simulado if tiempo_simulado else 0.0,
+            'por_nucleo': por_nucleo,
+        }
+
+
+def repartir_por_nucleo(traza, num_nucleos):
+    """(nucleo, direccion_virtual) -> lista de trazas por núcleo, conservando el orden de cada una."""
+    trazas = [[] for _ in range(num_nucleos)]
+    for nucleo, direccion_virtual in traza:
+        if not (0 <= nucleo < num_nucleos):
+            raise ValueError(f"Núcleo {nucleo} inválido (0..{num_nucleos-1})")
+        trazas[nucleo].append(direccion_virtual)
+    return trazas
+
+
+def _crear_mmu(configuracion, mapas, num_nucleos, args):
+    return MMUMultinucleo(
+        configuracion['TAMANO_MEMORIA_VIRTUAL'],
+        configuracion['TAMANO_MEMORIA_FISICA'],
+        configuracion['TAMANO_PAGINA'],
+        mapas,
+        entradas_decodificadas=True,
+        num_nucleos=num_nucleos,
+        entradas_tlb=args.entradas_tlb,
+        costo_derribo=args.costo_derribo,
+        costo_ipi=args.costo_ipi
+    )
+
+
+def _imprimir_fila(reporte):
+    print(f"{reporte['nucleos']:>7}{reporte['accesos']:>10}{reporte['fallos_pagina']:>8}"
+          f"{reporte['desalojos']:>10}{reporte['derribos_tlb']:>9}{reporte['ipis']:>7}"
+          f"{reporte['tasa_aciertos_tlb']:>8.3f}{reporte['fraccion_ciclos_derribo']:>10.3f}"
+          f"{reporte['accesos_por_ciclo'] * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MMU multinúcleo con TLB por núcleo y derribos de TLB")
+    parser.add_argument('--config', default='config1.txt', help="de aquí se toman TAMANO_* y los mapeos")
+    parser.add_argument('--traza', help="traza con líneas NUCLEO:DV (si no, se generan trazas Zipf)")
+    parser.add_argument('--nucleos', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--accesos', type=int, default=100_000, help="accesos por núcleo (trazas generadas)")
+    parser.add_argument('--exponente', type=float, default=1.0)
+    parser.add_argument('--entradas-tlb', type=int, default=64)
+    parser.add_argument('--costo-derribo', type=int, default=1_000)
+    parser.add_argument('--costo-ipi', type=int, default=500)
+    args = parser.parse_args()
+
+    try:
+        configuracion, mapas, _ = cargar_configuracion_rapida(args.config)
+        tamano_pagina = configuracion['TAMANO_PAGINA']
+        num_paginas = configuracion['TAMANO_MEMORIA_VIRTUAL'] // tamano_pagina
+        traza = list(leer_traza_con_procesos(args.traza)) if args.traza else None
+
+        print(f"{'núcleos':>7}{'accesos':>10}{'fallos':>8}{'desalojos':>10}{'derribos':>9}{'ipis':>7}"
+              f"{'TLB':>8}{'%derribo':>10}{'acc/kciclo':>12}")
+        for num_nucleos in args.nucleos:
+            mmu = _crear_mmu(configuracion, mapas, num_nucleos, args)
+            if traza is not None:
+                trazas = repartir_por_nucleo(traza, num_nucleos)
+            else:
+                # todos los núcleos comparten el espacio de direcciones, cada uno con su semilla
+                trazas = [list(generador_trazas.zipf(args.accesos, num_paginas, tamano_pagina,
+                                                     args.exponente, semilla=nucleo))
+                          for nucleo in range(num_nucleos)]
+            _imprimir_fila(mmu.ejecutar(trazas))
+    except (ValueError, KeyError, OSError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,200 @@
+#   Muestreo estadístico de trazas para estimar la tasa de fallos.
+#   En lugar de simular cada acceso en detalle se miden ventanas de
+#   'ventana' accesos, una por cada 'periodo' accesos. La ventana va al
+#   principio de su periodo (periódica) o en una posición al azar dentro de él
+#   (aleatoria, evita sincronizarse con bucles de la traza).
+#
+#   Entre ventanas la traza avanza sin medir:
+#     funcional - se aplican todos los accesos por rachas (aplicar_racha): la
+#                 tabla de páginas y las frecuencias quedan exactas.
+#     salto     - se descartan los accesos y sólo se aplican (por rachas) los
+#                 'calentamiento' accesos anteriores a cada ventana. Es lo más
+#                 rápido; el estado llega aproximado a la ventana.
+#
+#   Con las tasas de fallo de las ventanas se da la media y un intervalo de
+#   confianza (aproximación normal). verificar_muestreo() compara contra una
+#   corrida completa en trazas chicas.
+#
+#   Uso:
+#     python muestreo.py config.txt --ventana 1000 --periodo 100000 --verificar
+
+import sys
+import math
+import time
+import random
+import argparse
+import statistics
+from itertools import islice
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+from reduccion_traza import _a_entero, colapsar_rachas, simular_rachas
+
+MODOS = ('periodica', 'aleatoria')
+AVANCES = ('funcional', 'salto')
+
+
+def _descartar(iterador, cantidad):
+    """Consume hasta 'cantidad' elementos del iterador sin procesarlos. Devuelve cuántos consumió."""
+    return sum(1 for _ in islice(iterador, cantidad))
+
+
+def _inicios_ventanas(ventana, periodo, calentamiento_inicial, modo, semilla):
+    """Posiciones (en accesos) donde empieza cada ventana, en orden y sin fin."""
+    rng = random.Random(semilla)
+    inicio_periodo = calentamiento_inicial
+    while True:
+        desplazamiento = rng.randrange(periodo - ventana + 1) if modo == 'aleatoria' else 0
+        yield inicio_periodo + desplazamiento
+        inicio_periodo += periodo
+
+
+def intervalo_confianza(tasas, confianza=0.95):
+    """(media, semiancho) del intervalo normal para la media de las tasas; semiancho inf con menos de 2."""
+    media = statistics.fmean(tasas) if tasas else 0.0
+    if len(tasas) < 2:
+        return media, math.inf
+    z = statistics.NormalDist().inv_cdf((1 + confianza) / 2)
+    return media, z * statistics.stdev(tasas) / math.sqrt(len(tasas))
+
+
+def muestrear(traductor, direcciones, ventana=1_000, periodo=100_000, calentamiento=10_000,
+              calentamiento_inicial=0, modo='periodica', avance='funcional', confianza=0.95, semilla=0):
+    """
+    Estima la tasa de fallos de página de la traza (int o hex) sobre el traductor.
+    calentamiento_inicial son accesos que se aplican antes del primer periodo
+    sin medirlos (p. ej. para no muestrear el arranque en frío). Sólo cuentan
+    las ventanas completas. Devuelve un dict con la estimación, el intervalo y
+    cuántos accesos se midieron, aplicaron o descartaron.
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo '{modo}' desconocido (opciones: {', '.join(MODOS)})")
+    if avance not in AVANCES:
+        raise ValueError(f"Avance '{avance}' desconocido (opciones: {', '.join(AVANCES)})")
+    if not (0 < ventana <= periodo):
+        raise ValueError("Se necesita 0 < ventana <= periodo")
+
+    bits = traductor.bits_desplazamiento
+    traducir = traductor.traducir_entero
+    iterador = iter(_a_entero(direcciones))
+    leidos = aplicados = descartados = 0
+    tasas = []
+
+    for inicio in _inicios_ventanas(ventana, periodo, calentamiento_inicial, modo, semilla):
+        hueco = inicio - leidos
+        if avance == 'salto' and hueco > calentamiento:
+            saltados = _descartar(iterador, hueco - calentamiento)
+            descartados += saltados
+            leidos += saltados
+            hueco = calentamiento
+        avanzados = simular_rachas(traductor, colapsar_rachas(islice(iterador, hueco), bits))['accesos']
+        aplicados += avanzados
+        leidos += avanzados
+
+        fallos_previos = traductor.fallos_pagina
+        medidos = 0
+        for direccion_virtual in islice(iterador, ventana):
+            traducir(direccion_virtual)
+            medidos += 1
+        leidos += medidos
+        if medidos < ventana:
+            # se acabó la traza: la ventana incompleta no se usa
+            aplicados += medidos
+            break
+        tasas.append((traductor.fallos_pagina - fallos_previos) / ventana)
+
+    media, semiancho = intervalo_confianza(tasas, confianza)
+    return {
+        'accesos': leidos,
+        'ventanas': len(tasas),
+        'accesos_medidos': ventana * len(tasas),
+        'accesos_aplicados': aplicados,
+        'accesos_descartados': descartados,
+        'fraccion_medida': ventana * len(tasas) / leidos if leidos else 0.0,
+        'tasa_fallos': media,
+        'semiancho': semiancho,
+        'intervalo': (media - semiancho, media + semiancho),
+        'confianza': confianza,
+        'fallos_estimados': media * leidos,
+    }
+
+
+def verificar_muestreo(crear_traductor, direcciones, **opciones):
+    """
+    Corre la traza completa y muestreada, cada una con un traductor nuevo de
+    crear_traductor(), y compara. opciones se pasa a muestrear().
+    """
+    direcciones = list(_a_entero(direcciones))
+
+    traductor = crear_traductor()
+    inicio = time.perf_counter()
+    traductor.traducir_lote(direcciones)
+    tiempo_completo = time.perf_counter() - inicio
+    tasa_real = traductor.fallos_pagina / len(direcciones) if direcciones else 0.0
+
+    inicio = time.perf_counter()
+    estimacion = muestrear(crear_traductor(), direcciones, **opciones)
+    tiempo_muestreo = time.perf_counter() - inicio
+
+    error = estimacion['tasa_fallos'] - tasa_real
+    minimo, maximo = estimacion['intervalo']
+    return {
+        'tasa_real': tasa_real,
+        'estimacion': estimacion,
+        'error_absoluto': abs(error),
+        'error_relativo': abs(error) / tasa_real if tasa_real else 0.0,
+        'dentro_del_intervalo': minimo <= tasa_real <= maximo,
+        'tiempo_completo': tiempo_completo,
+        'tiempo_muestreo': tiempo_muestreo,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estimación de la tasa de fallos por muestreo de la traza")
+    parser.add_argument('config', help="archivo de configuración con la sección DIRECCIONES_VI")
+    parser.add_argument('--ventana', type=int, default=1_000)
+    parser.add_argument('--periodo', type=int, default=100_000)
+    parser.add_argument('--calentamiento', type=int, default=10_000)
+    parser.add_argument('--calentamiento-inicial', type=int, default=0)
+    parser.add_argument('--modo', choices=MODOS, default='periodica')
+    parser.add_argument('--avance', choices=AVANCES, default='funcional')
+    parser.add_argument('--confianza', type=float, default=0.95)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--verificar', action='store_true', help="comparar con la corrida completa")
+    args = parser.parse_args()
+
+    try:
+        configuracion, mapas, direcciones_vi_hex = cargar_configuracion_rapida(args.config)
+
+        def crear_traductor():
+            return TraductorDeDirecciones(
+                configuracion['TAMANO_MEMORIA_VIRTUAL'],
+                configuracion['TAMANO_MEMORIA_FISICA'],
+                configuracion['TAMANO_PAGINA'],
+                mapas,
+                entradas_decodificadas=True
+            )
+
+        opciones = dict(ventana=args.ventana, periodo=args.periodo, calentamiento=args.calentamiento,
+                        calentamiento_inicial=args.calentamiento_inicial, modo=args.modo,
+                        avance=args.avance, confianza=args.confianza, semilla=args.semilla)
+        if args.verificar:
+            verificacion = verificar_muestreo(crear_traductor, direcciones_vi_hex, **opciones)
+            estimacion = verificacion['estimacion']
+        else:
+            estimacion = muestrear(crear_traductor(), direcciones_vi_hex, **opciones)
+    except (ValueError, KeyError) as e:
+        print(f"❌ Error durante el muestreo: {e}")
+        sys.exit(1)
+
+    minimo, maximo = estimacion['intervalo']
+    print(f"Accesos: {estimacion['accesos']}  Ventanas: {estimacion['ventanas']}  "
+          f"Medidos: {estimacion['fraccion_medida'] * 100:.2f}%")
+    print(f"Tasa de fallos estimada: {estimacion['tasa_fallos']:.6f}  "
+          f"IC {estimacion['confianza'] * 100:.0f}%: [{minimo:.6f}, {maximo:.6f}]")
+    if args.verificar:
+        print(f"Tasa de fallos real:     {verificacion['tasa_real']:.6f}  "
+              f"error relativo: {verificacion['error_relativo'] * 100:.2f}%  "
+              f"{'dentro' if verificacion['dentro_del_intervalo'] else 'fuera'} del intervalo")
+        print(f"Tiempo completo: {verificacion['tiempo_completo']:.2f} s  "
+              f"muestreo: {verificacion['tiempo_muestreo']:.2f} s")
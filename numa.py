@@ -0,0 +1,224 @@
+#   Asignación de marcos consciente de NUMA.
+#   La memoria física se reparte en nodos de marcos contiguos (el nodo n tiene
+#   los marcos [n * marcos_por_nodo, (n + 1) * marcos_por_nodo)). Cada acceso
+#   viene de un nodo y cuesta la latencia entre ese nodo y el del marco
+#   (tabla de distancias al estilo SLIT).
+#
+#   Políticas de asignación de marcos libres:
+#     local       - primero el nodo que accede, luego los demás por cercanía.
+#     intercalada - los marcos se reparten por turnos entre los nodos.
+#     preferido   - primero nodo_preferido, luego los demás por cercanía a él.
+#   Sin marcos libres se reemplaza por LFU en toda la memoria, como siempre.
+#
+#   Formato de la traza (una línea por acceso):  NODO:DV   (DV en hexadecimal)
+#
+#   Uso:
+#     python numa.py config1.txt traza.txt --nodos 2 --latencia-local 100 --latencia-remota 180
+
+import sys
+import argparse
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+from simulacion_paralela import leer_traza_con_procesos
+
+POLITICAS = ('local', 'intercalada', 'preferido')
+
+
+class TraductorNUMA(TraductorDeDirecciones):
+    """
+    TraductorDeDirecciones con la memoria física dividida en nodos NUMA.
+
+    latencias[a][b] es la latencia de un acceso desde el nodo a a un marco del
+    nodo b; si no se da, se arma con latencia_local en la diagonal y
+    latencia_remota fuera de ella.
+    """
+
+    def __init__(self, tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                 entradas_decodificadas=False, num_nodos=2, politica='local', nodo_preferido=0,
+                 latencia_local=100, latencia_remota=200, latencias=None):
+        super().__init__(tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                         entradas_decodificadas)
+        if num_nodos <= 0 or self.num_marcos % num_nodos != 0:
+            raise ValueError(f"Los {self.num_marcos} marcos no se pueden repartir en {num_nodos} nodos iguales")
+        if politica not in POLITICAS:
+            raise ValueError(f"Política '{politica}' desconocida (opciones: {', '.join(POLITICAS)})")
+        if not (0 <= nodo_preferido < num_nodos):
+            raise ValueError(f"Nodo preferido {nodo_preferido} inválido (0..{num_nodos-1})")
+        if latencias is None:
+            latencias = [[latencia_local if a == b else latencia_remota for b in range(num_nodos)]
+                         for a in range(num_nodos)]
+        elif len(latencias) != num_nodos or any(len(fila) != num_nodos for fila in latencias):
+            raise ValueError(f"La tabla de latencias debe ser de {num_nodos}x{num_nodos}")
+
+        self.num_nodos = num_nodos
+        self.marcos_por_nodo = self.num_marcos // num_nodos
+        self.politica = politica
+        self.nodo_preferido = nodo_preferido
+        self.latencias = latencias
+        # para cada nodo, los nodos ordenados por latencia desde él (él primero si es el más cercano)
+        self._orden_por_cercania = [sorted(range(num_nodos), key=lambda b, a=a: (latencias[a][b], b != a, b))
+                                    for a in range(num_nodos)]
+        # por nodo: todos los marcos del nodo por debajo de la pista están ocupados
+        self._pistas_nodo = [n * self.marcos_por_nodo for n in range(num_nodos)]
+        self._siguiente_nodo = 0  # turno de la política intercalada
+        self._nodo_actual = 0     # nodo del acceso en curso
+
+        # estadísticas
+        self.accesos = 0
+        self.invalidas = 0
+        self.accesos_locales = 0
+        self.accesos_remotos = 0
+        self.latencia_total = 0
+        self.accesos_por_nodo = [[0] * num_nodos for _ in range(num_nodos)]  # [nodo que accede][nodo del marco]
+
+    def nodo_de_marco(self, marco):
+        return marco // self.marcos_por_nodo
+
+    # ---------------- Asignación ----------------
+
+    def _marco_libre_en_nodo(self, nodo):
+        """Marco libre más bajo del nodo, o None si el nodo está lleno."""
+        fin = (nodo + 1) * self.marcos_por_nodo
+        ocupados = self.marcos_ocupados
+        for m in range(self._pistas_nodo[nodo], fin):
+            if m not in ocupados:
+                self._pistas_nodo[nodo] = m
+                return m
+        self._pistas_nodo[nodo] = fin
+        return None
+
+    def _encontrar_marco_libre(self):
+        """Marco libre según la política, o None si no queda ninguno en ningún nodo."""
+        if len(self.marcos_ocupados) >= self.num_marcos:
+            return None
+        if self.politica == 'intercalada':
+            for i in range(self.num_nodos):
+                nodo = (self._siguiente_nodo + i) % self.num_nodos
+                marco = self._marco_libre_en_nodo(nodo)
+                if marco is not None:
+                    self._siguiente_nodo = (nodo + 1) % self.num_nodos
+                    return marco
+            return None
+
+        origen = self._nodo_actual if self.politica == 'local' else self.nodo_preferido
+        for nodo in self._orden_por_cercania[origen]:
+            marco = self._marco_libre_en_nodo(nodo)
+            if marco is not None:
+                return marco
+        return None
+
+    def _liberar_marco(self, marco):
+        super()._liberar_marco(marco)
+        nodo = self.nodo_de_marco(marco)
+        if marco < self._pistas_nodo[nodo]:
+            self._pistas_nodo[nodo] = marco
+
+    # ---------------- Accesos ----------------
+
+    def acceder(self, nodo, direccion_virtual):
+        """
+        Traduce un acceso (int) hecho desde 'nodo' y suma su latencia.
+        Devuelve la dirección física o None si la dirección es inválida.
+        """
+        if not (0 <= nodo < self.num_nodos):
+            raise ValueError(f"Nodo {nodo} inválido (0..{self.num_nodos-1})")
+        self._nodo_actual = nodo
+        direccion_fisica = self.traducir_entero(direccion_virtual)
+        if direccion_fisica is None:
+            self.invalidas += 1
+            return None
+
+        nodo_marco = self.nodo_de_marco(direccion_fisica >> self.bits_desplazamiento)
+        self.accesos += 1
+        self.accesos_por_nodo[nodo][nodo_marco] += 1
+        self.latencia_total += self.latencias[nodo][nodo_marco]
+        if nodo_marco == nodo:
+            self.accesos_locales += 1
+        else:
+            self.accesos_remotos += 1
+        return direccion_fisica
+
+    def simular(self, traza):
+        """Aplica una secuencia de (nodo, direccion_virtual) y devuelve reporte_numa()."""
+        acceder = self.acceder
+        for nodo, direccion_virtual in traza:
+            acceder(nodo, direccion_virtual)
+        return self.reporte_numa()
+
+    def reporte_numa(self):
+        """
+        Proporción de accesos locales/remotos y latencia media. impacto_latencia
+        es cuánto más lenta fue la corrida que si todos los accesos hubieran sido
+        locales (0.25 = 25 % más lenta).
+        """
+        latencia_ideal = sum(self.latencias[nodo][nodo] * sum(fila)
+                             for nodo, fila in enumerate(self.accesos_por_nodo))
+        marcos_por_nodo = [0] * self.num_nodos
+        for marco in self.marcos_ocupados:
+            marcos_por_nodo[self.nodo_de_marco(marco)] += 1
+        return {
+            'politica': self.politica,
+            'accesos': self.accesos,
+            'invalidas': self.invalidas,
+            'fallos_pagina': self.fallos_pagina,
+            'accesos_locales': self.accesos_locales,
+            'accesos_remotos': self.accesos_remotos,
+            'proporcion_local': self.accesos_locales / self.accesos if self.accesos else 0.0,
+            'latencia_media': self.latencia_total / self.accesos if self.accesos else 0.0,
+            'impacto_latencia': self.latencia_total / latencia_ideal - 1 if latencia_ideal else 0.0,
+            'marcos_ocupados_por_nodo': marcos_por_nodo,
+            'accesos_por_nodo': [list(fila) for fila in self.accesos_por_nodo],
+        }
+
+
+def comparar_politicas(configuracion, mapas, traza, politicas=POLITICAS, **opciones):
+    """
+    Simula la misma traza (lista de (nodo, direccion_virtual)) con cada política,
+    cada una sobre un traductor recién creado. Devuelve {politica: reporte_numa()}.
+    opciones se pasa a TraductorNUMA (num_nodos, latencias, nodo_preferido, ...).
+    """
+    reportes = {}
+    for politica in politicas:
+        traductor = TraductorNUMA(
+            configuracion['TAMANO_MEMORIA_VIRTUAL'],
+            configuracion['TAMANO_MEMORIA_FISICA'],
+            configuracion['TAMANO_PAGINA'],
+            mapas,
+            entradas_decodificadas=True,
+            politica=politica,
+            **opciones
+        )
+        reportes[politica] = traductor.simular(traza)
+    return reportes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Asignación de marcos NUMA: comparación de políticas")
+    parser.add_argument('config', help="archivo de configuración (TAMANO_* y mapeos)")
+    parser.add_argument('traza', help="traza con líneas NODO:DV")
+    parser.add_argument('--nodos', type=int, default=2)
+    parser.add_argument('--latencia-local', type=int, default=100)
+    parser.add_argument('--latencia-remota', type=int, default=200)
+    parser.add_argument('--nodo-preferido', type=int, default=0)
+    parser.add_argument('--politica', choices=POLITICAS, help="sólo esta política (por defecto, todas)")
+    args = parser.parse_args()
+
+    try:
+        configuracion, mapas, _ = cargar_configuracion_rapida(args.config)
+        traza = list(leer_traza_con_procesos(args.traza))
+        reportes = comparar_politicas(configuracion, mapas, traza,
+                                      politicas=[args.politica] if args.politica else POLITICAS,
+                                      num_nodos=args.nodos,
+                                      nodo_preferido=args.nodo_preferido,
+                                      latencia_local=args.latencia_local,
+                                      latencia_remota=args.latencia_remota)
+    except (ValueError, KeyError, OSError) as e:
+        print(f"❌ Error durante la simulación: {e}")
+        sys.exit(1)
+
+    print(f"\n{'política':<13}{'locales':>10}{'remotos':>10}{'% local':>9}{'lat. media':>12}{'impacto':>9}{'fallos':>8}")
+    for politica, reporte in reportes.items():
+        print(f"{politica:<13}{reporte['accesos_locales']:>10}{reporte['accesos_remotos']:>10}"
+              f"{reporte['proporcion_local'] * 100:>8.1f}%{reporte['latencia_media']:>12.1f}"
+              f"{reporte['impacto_latencia'] * 100:>8.1f}%{reporte['fallos_pagina']:>8}")
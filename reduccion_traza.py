@@ -0,0 +1,104 @@
+#   Reducción de trazas sin pérdida.
+#   Las trazas reales tocan la misma página muchas veces seguidas. Cada racha
+#   de accesos consecutivos a una misma página se colapsa en un registro
+#   (pagina, cuenta) que el traductor aplica de una vez con aplicar_racha().
+#
+#   Dentro de una racha no se accede a ninguna otra página, así que sólo el
+#   primer acceso puede fallar o provocar un reemplazo y el resto sólo suma
+#   uso: el resultado final de fallos y reemplazos es idéntico al de la traza
+#   completa.
+#
+#   Formato de traza reducida (una línea por racha):  PAGINA CUENTA   (decimal)
+#
+#   Uso:
+#     python reduccion_traza.py config1.txt [--salida traza_reducida.txt]
+
+import sys
+import argparse
+from itertools import groupby
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+
+
+def _a_entero(direcciones):
+    """Convierte direcciones hex (string) a int; las inválidas se descartan (no cambian el estado)."""
+    for dv in direcciones:
+        if isinstance(dv, int):
+            yield dv
+            continue
+        try:
+            yield int(str(dv), 16)
+        except ValueError:
+            continue
+
+
+def colapsar_rachas(direcciones, bits_desplazamiento):
+    """
+    Genera (pagina, cuenta) por cada racha de accesos consecutivos a la misma
+    página. Funciona en flujo: no guarda la traza en memoria.
+    """
+    for pagina, grupo in groupby(dv >> bits_desplazamiento for dv in _a_entero(direcciones)):
+        yield pagina, sum(1 for _ in grupo)
+
+
+def simular_rachas(traductor, rachas):
+    """Aplica una secuencia de (pagina, cuenta) al traductor y devuelve los contadores de la corrida."""
+    accesos = num_rachas = invalidas = 0
+    aplicar = traductor.aplicar_racha
+    for pagina, cuenta in rachas:
+        num_rachas += 1
+        accesos += cuenta
+        if aplicar(pagina, cuenta) is None:
+            invalidas += cuenta
+    return {
+        'accesos': accesos,
+        'rachas': num_rachas,
+        'invalidas': invalidas,
+        'fallos_pagina': traductor.fallos_pagina,
+        'factor_reduccion': accesos / num_rachas if num_rachas else 1.0,
+    }
+
+
+def escribir_traza_reducida(rachas, nombre_archivo):
+    with open(nombre_archivo, 'w') as f:
+        for pagina, cuenta in rachas:
+            f.write(f"{pagina} {cuenta}\n")
+
+
+def leer_traza_reducida(nombre_archivo):
+    with open(nombre_archivo, 'r') as f:
+        for linea in f:
+            linea = linea.strip()
+            if not linea or linea.startswith('#'):
+                continue
+            pagina, cuenta = linea.split()
+            yield int(pagina), int(cuenta)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reducción de trazas por rachas de página")
+    parser.add_argument('config', help="archivo de configuración con la sección DIRECCIONES_VI")
+    parser.add_argument('--salida', help="guardar la traza reducida en este archivo")
+    args = parser.parse_args()
+
+    try:
+        configuracion, mapas, direcciones_vi_hex = cargar_configuracion_rapida(args.config)
+        traductor = TraductorDeDirecciones(
+            configuracion['TAMANO_MEMORIA_VIRTUAL'],
+            configuracion['TAMANO_MEMORIA_FISICA'],
+            configuracion['TAMANO_PAGINA'],
+            mapas,
+            entradas_decodificadas=True
+        )
+        rachas = list(colapsar_rachas(direcciones_vi_hex, traductor.bits_desplazamiento))
+        if args.salida:
+            escribir_traza_reducida(rachas, args.salida)
+        resultado = simular_rachas(traductor, rachas)
+    except (ValueError, KeyError, OSError) as e:
+        print(f"❌ Error durante la reducción: {e}")
+        sys.exit(1)
+
+    print(f"Accesos: {resultado['accesos']}  →  Rachas: {resultado['rachas']} "
+          f"(reducción x{resultado['factor_reduccion']:.2f})")
+    print(f"🔢 Fallos de página: {resultado['fallos_pagina']}")
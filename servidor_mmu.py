@@ -0,0 +1,277 @@
+#   Servidor local de traducción de direcciones.
+#   Expone un único TraductorDeDirecciones a varias herramientas a la vez,
+#   por un socket Unix o por TCP en localhost.
+#
+#   Uso:
+#     python servidor_mmu.py --config config1.txt --unix /tmp/mmu.sock
+#     python servidor_mmu.py --config config1.txt --puerto 8765
+
+import sys
+import asyncio
+import argparse
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+
+# tamaño máximo de una línea (petición o respuesta), en bytes: unos 2 millones de direcciones
+LIMITE_LINEA = 16 * 1024 * 1024
+
+
+def _a_entero(campo):
+    try:
+        return int(campo, 16)
+    except ValueError:
+        return None
+
+
+def _formatear_resultados(resultados):
+    """Convierte [(df, fallo), ...] en la línea de respuesta 'DF:F DF:F ...\\n'."""
+    return (' '.join(f"{df:X}:{int(fallo)}" if df is not None else f"-:{int(fallo)}"
+                     for df, fallo in resultados) + '\n').encode('ascii')
+
+
+class ServidorMMU:
+    """
+    Servicio asyncio que comparte un TraductorDeDirecciones entre varios clientes.
+
+    Protocolo de texto, una petición por línea y exactamente una línea de
+    respuesta por petición. Un cliente puede enviar varias líneas seguidas sin
+    esperar respuesta; las respuestas llegan en el mismo orden.
+      - 'DV1 DV2 ...': direcciones virtuales en hexadecimal separadas por espacios.
+        Respuesta: 'DF1:F1 DF2:F2 ...', con la dirección física en hexadecimal
+        ('-' si es inválida) y la bandera de fallo de página (0/1). Una línea
+        vacía es un lote vacío y se responde con una línea vacía.
+      - 'STATS': Respuesta 'accesos=N fallos=M marcos_ocupados=K lotes=L'.
+    Si una petición falla en el servidor, o es más larga que limite_linea
+    bytes, se responde 'ERROR <mensaje>'.
+
+    Las peticiones de todas las conexiones se encolan y una única tarea las
+    traduce en lotes de hasta tam_lote direcciones. Como sólo esa tarea toca el
+    traductor, los fallos modifican tabla_de_paginas siempre en un orden bien
+    definido (el de llegada a la cola).
+    """
+
+    def __init__(self, traductor, tam_lote=4096, limite_linea=LIMITE_LINEA):
+        self.traductor = traductor
+        self.tam_lote = tam_lote
+        self.limite_linea = limite_linea
+        # contadores del servicio
+        self.accesos = 0
+        self.lotes_procesados = 0
+        self._cola = None
+        self._tarea_lotes = None
+
+    def _linea_estadisticas(self):
+        return (f"accesos={self.accesos} fallos={self.traductor.fallos_pagina} "
+                f"marcos_ocupados={len(self.traductor.marcos_ocupados)} "
+                f"lotes={self.lotes_procesados}\n").encode('ascii')
+
+    def _traducir_peticion(self, campos):
+        """Traduce las direcciones de una petición con una sola llamada a traducir_lote."""
+        direcciones = [_a_entero(campo) for campo in campos]
+        validas = [dv for dv in direcciones if dv is not None]
+        posiciones_fallo = []
+        fisicas = iter(self.traductor.traducir_lote(validas, posiciones_fallo))
+        fallos = set(posiciones_fallo)
+        resultados = []
+        i = 0
+        for dv in direcciones:
+            if dv is None:
+                resultados.append((None, False))  # hex inválido: no toca el traductor
+                continue
+            resultados.append((next(fisicas), i in fallos))
+            i += 1
+        return resultados
+
+    async def _procesar_lotes(self):
+        """Tarea única que junta peticiones de todas las conexiones y las traduce en lote."""
+        cola = self._cola
+        while True:
+            pendientes = [await cola.get()]
+            total = len(pendientes[0][0] or ())
+            # juntar todo lo que ya esté esperando, hasta llenar el lote
+            while total < self.tam_lote and not cola.empty():
+                peticion = cola.get_nowait()
+                pendientes.append(peticion)
+                total += len(peticion[0] or ())
+
+            self.lotes_procesados += 1
+            for direcciones, futuro in pendientes:
+                # un error en una petición no puede tirar esta tarea: es la única que atiende a todos
+                try:
+                    if direcciones is None:
+                        resultado = self._linea_estadisticas()
+                    else:
+                        resultado = self._traducir_peticion(direcciones)
+                        self.accesos += len(direcciones)
+                except Exception as e:
+                    resultado = f"ERROR {e}".replace('\n', ' ').encode('ascii', 'replace') + b'\n'
+                if not futuro.cancelled():
+                    futuro.set_result(resultado)
+
+            # ceder el control para que las conexiones acumulen el siguiente lote
+            await asyncio.sleep(0)
+
+    async def _escribir_respuestas(self, respuestas, escritor):
+        """Escribe las respuestas de una conexión en el orden en que llegaron sus peticiones."""
+        while True:
+            futuro = await respuestas.get()
+            if futuro is None:
+                break
+            resultado = await futuro
+            escritor.write(resultado if isinstance(resultado, bytes) else _formatear_resultados(resultado))
+            if respuestas.empty():
+                await escritor.drain()
+
+    async def _leer_linea(self, lector):
+        """
+        Lee una petición. Devuelve (linea, demasiado_larga); linea es b'' al
+        cerrarse la conexión. Una línea de más de limite_linea bytes se descarta
+        entera (hasta su '\\n') para que la siguiente petición se lea bien.
+        """
+        try:
+            return await lector.readuntil(b'\n'), False
+        except asyncio.IncompleteReadError as e:
+            return e.partial, False  # última línea sin '\n'
+        except asyncio.LimitOverrunError as e:
+            exceso = e
+        while True:
+            try:
+                await lector.readexactly(exceso.consumed)
+                await lector.readuntil(b'\n')
+                return None, True
+            except asyncio.LimitOverrunError as e:
+                exceso = e
+            except asyncio.IncompleteReadError:
+                return b'', True
+
+    async def _atender_cliente(self, lector, escritor):
+        loop = asyncio.get_running_loop()
+        respuestas = asyncio.Queue()
+        tarea_escritura = asyncio.create_task(self._escribir_respuestas(respuestas, escritor))
+        try:
+            while True:
+                linea, demasiado_larga = await self._leer_linea(lector)
+                if demasiado_larga:
+                    futuro = loop.create_future()
+                    futuro.set_result(f"ERROR linea de mas de {self.limite_linea} bytes\n".encode('ascii'))
+                    respuestas.put_nowait(futuro)
+                    if linea is None:
+                        continue
+                if not linea:
+                    break
+                # toda línea, aun vacía, lleva su respuesta: el cliente cuenta una por petición
+                campos = linea.decode('ascii', 'replace').split()
+                futuro = loop.create_future()
+                self._cola.put_nowait((None if campos == ['STATS'] else campos, futuro))
+                respuestas.put_nowait(futuro)
+        except ConnectionError:
+            pass
+        finally:
+            respuestas.put_nowait(None)
+            try:
+                await tarea_escritura
+            except ConnectionError:
+                pass
+            escritor.close()
+
+    async def iniciar(self, ruta_unix=None, host='127.0.0.1', puerto=8765):
+        """Arranca la tarea de lotes y el servidor. Devuelve el asyncio.Server."""
+        self._cola = asyncio.Queue()
+        self._tarea_lotes = asyncio.create_task(self._procesar_lotes())
+        if ruta_unix:
+            return await asyncio.start_unix_server(self._atender_cliente, path=ruta_unix, limit=self.limite_linea)
+        return await asyncio.start_server(self._atender_cliente, host, puerto, limit=self.limite_linea)
+
+    async def detener(self, servidor):
+        servidor.close()
+        await servidor.wait_closed()
+        if self._tarea_lotes is not None:
+            self._tarea_lotes.cancel()
+
+
+class ClienteMMU:
+    """Cliente mínimo para ServidorMMU (una conexión, peticiones encadenadas)."""
+
+    def __init__(self, lector, escritor):
+        self._lector = lector
+        self._escritor = escritor
+
+    @classmethod
+    async def conectar(cls, ruta_unix=None, host='127.0.0.1', puerto=8765, limite_linea=LIMITE_LINEA):
+        if ruta_unix:
+            lector, escritor = await asyncio.open_unix_connection(ruta_unix, limit=limite_linea)
+        else:
+            lector, escritor = await asyncio.open_connection(host, puerto, limit=limite_linea)
+        return cls(lector, escritor)
+
+    async def traducir_lotes(self, lotes):
+        """
+        Envía todos los lotes sin esperar y luego lee las respuestas.
+        Cada lote es una lista de direcciones (int o string hex). Devuelve, por lote,
+        una lista de (direccion_fisica o None, hubo_fallo). Un lote vacío devuelve [].
+        """
+        for lote in lotes:
+            self._escritor.write((' '.join(f"{dv:X}" if isinstance(dv, int) else str(dv)
+                                           for dv in lote) + '\n').encode('ascii'))
+        await self._escritor.drain()
+
+        resultados = []
+        for _ in lotes:
+            linea = (await self._lector.readline()).decode('ascii')
+            if not linea:
+                raise ConnectionError("El servidor cerró la conexión")
+            if linea.startswith('ERROR'):
+                raise ValueError(f"El servidor respondió: {linea[5:].strip()}")
+            lote = []
+            for campo in linea.split():
+                df, fallo = campo.split(':')
+                lote.append((None if df == '-' else int(df, 16), fallo == '1'))
+            resultados.append(lote)
+        return resultados
+
+    async def traducir_lote(self, direcciones):
+        return (await self.traducir_lotes([direcciones]))[0]
+
+    async def estadisticas(self):
+        self._escritor.write(b'STATS\n')
+        await self._escritor.drain()
+        linea = (await self._lector.readline()).decode('ascii').split()
+        return {clave: int(valor) for clave, valor in (campo.split('=') for campo in linea)}
+
+    async def cerrar(self):
+        self._escritor.close()
+        await self._escritor.wait_closed()
+
+
+async def _servir(args):
+    configuracion, mapas, _ = cargar_configuracion_rapida(args.config)
+    traductor = TraductorDeDirecciones(
+        configuracion['TAMANO_MEMORIA_VIRTUAL'],
+        configuracion['TAMANO_MEMORIA_FISICA'],
+        configuracion['TAMANO_PAGINA'],
+        mapas,
+        entradas_decodificadas=True
+    )
+    servicio = ServidorMMU(traductor, tam_lote=args.tam_lote)
+    servidor = await servicio.iniciar(ruta_unix=args.unix, host=args.host, puerto=args.puerto)
+    destino = args.unix if args.unix else f"{args.host}:{args.puerto}"
+    print(f"🖥️  Servidor MMU escuchando en {destino} (lotes de hasta {args.tam_lote} direcciones)")
+    async with servidor:
+        await servidor.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor local de traducción de direcciones")
+    parser.add_argument('--config', default='config1.txt', help="archivo de configuración")
+    parser.add_argument('--unix', help="ruta del socket Unix (si no se indica, se usa TCP)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--tam-lote', type=int, default=4096, help="máximo de direcciones por lote")
+    try:
+        asyncio.run(_servir(parser.parse_args()))
+    except (ValueError, KeyError) as e:
+        print(f"\nError durante la ejecución: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\n\nServidor detenido.")
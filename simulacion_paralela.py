@@ -0,0 +1,173 @@
+#   Simulación en paralelo de espacios de direcciones independientes.
+#   Cada proceso de la traza tiene su propia partición de marcos, así que se
+#   puede simular con su propio TraductorDeDirecciones en un núcleo distinto.
+#
+#   Formato de la traza (una línea por acceso):  PID:DV   (DV en hexadecimal)
+#
+#   Uso:
+#     python simulacion_paralela.py config.txt traza.txt --trabajadores 4
+
+import os
+import sys
+import argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+
+
+def leer_traza_con_procesos(nombre_archivo):
+    """Genera (pid, direccion_virtual) desde un archivo con líneas 'PID:DV' (DV en hex)."""
+    with open(nombre_archivo, 'r') as f:
+        for linea in f:
+            linea = linea.strip()
+            if not linea or linea.startswith('#'):
+                continue
+            pid, dv = linea.split(':', 1)
+            yield int(pid), int(dv, 16)
+
+
+def _particionar(traza):
+    """Reparte la traza por proceso en arrays de enteros sin signo de 64 bits."""
+    particiones = {}
+    for pid, direccion in traza:
+        buffer = particiones.get(pid)
+        if buffer is None:
+            buffer = particiones[pid] = array('Q')
+        buffer.append(direccion)
+    return particiones
+
+
+# configuraciones de los trabajadores: se reciben una vez por trabajador (ver _iniciar_trabajador)
+_configuraciones = None
+_configuracion_por_pid = False
+
+
+def _iniciar_trabajador(configuraciones, por_pid):
+    global _configuraciones, _configuracion_por_pid
+    _configuraciones = configuraciones
+    _configuracion_por_pid = por_pid
+
+
+def _simular_particion(nombre_memoria, inicio, longitud, pid):
+    """
+    Trabajador: se conecta al bloque de memoria compartida, toma su rango de
+    direcciones y lo simula con un traductor propio. Devuelve sólo contadores.
+    """
+    configuracion = _configuraciones[pid] if _configuracion_por_pid else _configuraciones
+    traductor = TraductorDeDirecciones(
+        configuracion['TAMANO_MEMORIA_VIRTUAL'],
+        configuracion['TAMANO_MEMORIA_FISICA'],
+        configuracion['TAMANO_PAGINA'],
+        configuracion.get('MAPEOS', {}),
+        entradas_decodificadas=True
+    )
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    vista = memoria.buf.cast('Q')
+    try:
+        invalidas = traductor.traducir_lote(vista[inicio:inicio + longitud]).count(None)
+    finally:
+        vista.release()
+        memoria.close()
+
+    return {
+        'pid': pid,
+        'accesos': longitud,
+        'fallos_pagina': traductor.fallos_pagina,
+        'invalidas': invalidas,
+        'marcos_ocupados': len(traductor.marcos_ocupados),
+    }
+
+
+def combinar_estadisticas(resultados):
+    """Une los contadores por proceso en orden de PID, así el total no depende del orden de llegada."""
+    por_proceso = {r['pid']: r for r in sorted(resultados, key=lambda r: r['pid'])}
+    for r in por_proceso.values():
+        r['tasa_fallos'] = r['fallos_pagina'] / r['accesos'] if r['accesos'] else 0.0
+    accesos = sum(r['accesos'] for r in por_proceso.values())
+    fallos = sum(r['fallos_pagina'] for r in por_proceso.values())
+    return {
+        'por_proceso': por_proceso,
+        'accesos': accesos,
+        'fallos_pagina': fallos,
+        'invalidas': sum(r['invalidas'] for r in por_proceso.values()),
+        'tasa_fallos': fallos / accesos if accesos else 0.0,
+    }
+
+
+def simular_en_paralelo(traza, configuraciones, num_trabajadores=None):
+    """
+    Simula cada proceso de la traza con su propio traductor en un proceso aparte.
+
+    traza: iterable de (pid, direccion_virtual int).
+    configuraciones: dict con TAMANO_MEMORIA_VIRTUAL, TAMANO_MEMORIA_FISICA,
+        TAMANO_PAGINA y opcionalmente MAPEOS (tabla ya decodificada), común a
+        todos los procesos; o bien un dict {pid: esa configuración}.
+
+    Las particiones se copian una sola vez a un bloque de memoria compartida y
+    cada tarea lleva sólo (nombre, inicio, longitud, pid), sin serializar las
+    direcciones. Las configuraciones (con sus MAPEOS) se envían una vez por
+    trabajador, al iniciarlo, y no una vez por proceso de la traza. Devuelve
+    las estadísticas combinadas (ver combinar_estadisticas).
+    """
+    particiones = _particionar(traza)
+    if not particiones:
+        return combinar_estadisticas([])
+
+    por_pid = 'TAMANO_PAGINA' not in configuraciones
+    faltantes = [pid for pid in particiones if por_pid and pid not in configuraciones]
+    if faltantes:
+        raise KeyError(f"No hay configuración para los procesos {sorted(faltantes)}")
+
+    total = sum(len(b) for b in particiones.values())
+    memoria = shared_memory.SharedMemory(create=True, size=total * 8)
+    try:
+        vista = memoria.buf.cast('Q')
+        tareas = []
+        inicio = 0
+        for pid in sorted(particiones):
+            buffer = particiones[pid]
+            vista[inicio:inicio + len(buffer)] = buffer
+            tareas.append((memoria.name, inicio, len(buffer), pid))
+            inicio += len(buffer)
+        vista.release()
+        particiones.clear()
+
+        num_trabajadores = min(num_trabajadores or os.cpu_count() or 1, len(tareas))
+        if por_pid:
+            # sólo las de los procesos que aparecen en la traza
+            configuraciones = {pid: configuraciones[pid] for pid in sorted(set(t[3] for t in tareas))}
+        with ProcessPoolExecutor(max_workers=num_trabajadores, initializer=_iniciar_trabajador,
+                                 initargs=(configuraciones, por_pid)) as ejecutor:
+            futuros = [ejecutor.submit(_simular_particion, *tarea) for tarea in tareas]
+            resultados = [f.result() for f in futuros]
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+    return combinar_estadisticas(resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulación en paralelo por proceso")
+    parser.add_argument('config', help="archivo de configuración (común a todos los procesos)")
+    parser.add_argument('traza', help="archivo con líneas PID:DV")
+    parser.add_argument('--trabajadores', type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        configuracion, mapas, _ = cargar_configuracion_rapida(args.config)
+        configuracion = dict(configuracion, MAPEOS=mapas)
+        estadisticas = simular_en_paralelo(leer_traza_con_procesos(args.traza), configuracion, args.trabajadores)
+    except (ValueError, KeyError, OSError) as e:
+        print(f"❌ Error durante la simulación: {e}")
+        sys.exit(1)
+
+    print(f"{'PID':<8}{'Accesos':<12}{'Fallos':<10}{'Tasa fallos':<12}")
+    for pid, r in estadisticas['por_proceso'].items():
+        print(f"{pid:<8}{r['accesos']:<12}{r['fallos_pagina']:<10}{r['tasa_fallos']:<12.4f}")
+    print("-" * 42)
+    print(f"{'Total':<8}{estadisticas['accesos']:<12}{estadisticas['fallos_pagina']:<10}"
+          f"{estadisticas['tasa_fallos']:<12.4f}")
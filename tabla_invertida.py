@@ -0,0 +1,325 @@
+#   Tabla de páginas invertida con tabla hash de anclas.
+#   Hay una entrada por marco físico (num_marcos), no por página virtual: la
+#   entrada del marco m dice qué página está en m. Para traducir se calcula un
+#   hash de la página, se lee el ancla correspondiente y se sigue la cadena de colisiones (campo
+#   'siguiente' de cada entrada) hasta encontrar la página.
+#
+#   Así la memoria crece con la memoria física y no con el espacio virtual.
+#   Las páginas no residentes que conservan bits de control se guardan aparte
+#   (como la tabla de software que acompaña a una tabla invertida real).
+#
+#   Una tabla invertida no puede representar dos páginas en el mismo marco, así
+#   que no sirve con TraductorCompartido. Hay un único espacio de direcciones:
+#   el traductor lleva las páginas presentes, frecuencias y marcos por número de
+#   página, así que varios ASID en la misma tabla necesitarían que también él
+#   los distinga.
+#
+#   TraductorInvertido usa esta tabla y separa las búsquedas de traducción
+#   (una por acceso) de las lecturas internas al atender un fallo, para que
+#   los sondeos por traducción midan sólo el costo de traducir.
+#
+#   Uso:
+#     python tabla_invertida.py config1.txt --factor-ancla 2
+
+import sys
+import math
+import argparse
+from array import array
+
+from traduccion_LFU import TraductorDeDirecciones
+from cargarDatos import cargar_configuracion_rapida
+
+# igual que TraductorDeDirecciones.BITS_CONTROL_TOTAL
+_BITS_CONTROL = 5
+_MULTIPLICADOR_HASH = 0x9E3779B97F4A7C15  # hash multiplicativo de Fibonacci (64 bits)
+_MASCARA_64 = (1 << 64) - 1
+_VACIO = -1
+
+
+def _bytes_para(bits):
+    return max(1, math.ceil(bits / 8))
+
+
+class TablaPaginasInvertida:
+    """
+    Tabla invertida con la interfaz que usa TraductorDeDirecciones sobre su
+    dict (get, [], in, items, update). get(pagina) devuelve la entrada
+    empaquetada, igual que la tabla plana; las páginas nunca escritas valen 0
+    y 'pagina in tabla' es True sólo para entradas distintas de 0.
+
+    Cuenta todas las búsquedas (busquedas, sondeos) y, aparte, las de
+    traducción: las de get() mientras en_fallo es False (lo maneja TraductorInvertido).
+    """
+
+    def __init__(self, num_paginas, entrada_bits, factor_ancla=2):
+        self.num_paginas = num_paginas
+        self.entrada_bits = entrada_bits
+        self.bits_marco = entrada_bits - _BITS_CONTROL
+        self.num_marcos = 1 << self.bits_marco
+        self.mascara_marco = self.num_marcos - 1
+        self.mascara_presente = 1 << self.bits_marco
+        self.bits_pagina = max(1, (num_paginas - 1).bit_length())
+
+        # tabla de anclas: potencia de 2 >= factor_ancla * num_marcos
+        self.bits_ancla = max(1, math.ceil(math.log2(max(2, factor_ancla * self.num_marcos))))
+        self.num_anclas = 1 << self.bits_ancla
+        self.anclas = array('q', [_VACIO]) * self.num_anclas
+
+        # una entrada por marco: página, entrada empaquetada y siguiente de la cadena
+        self.paginas = array('q', [_VACIO]) * self.num_marcos
+        self.entradas = array('q', [0]) * self.num_marcos
+        self.siguiente = array('q', [_VACIO]) * self.num_marcos
+        self.residentes = 0
+        # pagina -> entrada de las páginas no residentes con bits de control
+        self._no_residentes = {}
+
+        # estadísticas: todas las búsquedas y sólo las de traducción
+        self.busquedas = 0
+        self.sondeos = 0
+        self.busquedas_traduccion = 0
+        self.sondeos_traduccion = 0
+        self.en_fallo = False  # True mientras el traductor atiende un fallo (lecturas internas)
+
+    def _ancla(self, pagina):
+        return ((pagina * _MULTIPLICADOR_HASH) & _MASCARA_64) >> (64 - self.bits_ancla)
+
+    def buscar(self, pagina, contar=True, traduccion=False):
+        """
+        Marco donde está la página, o None. Con contar=True suma a
+        busquedas/sondeos y, si además traduccion=True, a los de traducción.
+        """
+        marco = self.anclas[self._ancla(pagina)]
+        sondeos = 0
+        while marco != _VACIO:
+            sondeos += 1
+            if self.paginas[marco] == pagina:
+                break
+            marco = self.siguiente[marco]
+        if contar:
+            self.busquedas += 1
+            self.sondeos += sondeos
+            if traduccion:
+                self.busquedas_traduccion += 1
+                self.sondeos_traduccion += sondeos
+        return None if marco == _VACIO else marco
+
+    def _enlazar(self, marco, pagina, entrada):
+        if self.paginas[marco] != _VACIO:
+            raise ValueError(f"El marco {marco} ya tiene la página {self.paginas[marco]} "
+                             f"(una tabla invertida no admite marcos compartidos)")
+        ancla = self._ancla(pagina)
+        self.paginas[marco] = pagina
+        self.entradas[marco] = entrada
+        self.siguiente[marco] = self.anclas[ancla]
+        self.anclas[ancla] = marco
+        self.residentes += 1
+
+    def _desenlazar(self, marco):
+        ancla = self._ancla(self.paginas[marco])
+        actual = self.anclas[ancla]
+        if actual == marco:
+            self.anclas[ancla] = self.siguiente[marco]
+        else:
+            while self.siguiente[actual] != marco:
+                actual = self.siguiente[actual]
+            self.siguiente[actual] = self.siguiente[marco]
+        self.paginas[marco] = _VACIO
+        self.siguiente[marco] = _VACIO
+        self.entradas[marco] = 0
+        self.residentes -= 1
+
+    # --- interfaz tipo dict ---
+
+    def get(self, pagina, por_defecto=None):
+        if not (0 <= pagina < self.num_paginas):
+            return por_defecto
+        marco = self.buscar(pagina, traduccion=not self.en_fallo)
+        if marco is not None:
+            return self.entradas[marco]
+        return self._no_residentes.get(pagina, 0)
+
+    def __getitem__(self, pagina):
+        # sólo lo usa el traductor para leer entradas al reemplazar: nunca es una traducción
+        if not (0 <= pagina < self.num_paginas):
+            raise KeyError(pagina)
+        marco = self.buscar(pagina)
+        if marco is not None:
+            return self.entradas[marco]
+        return self._no_residentes.get(pagina, 0)
+
+    def __setitem__(self, pagina, entrada):
+        if not (0 <= pagina < self.num_paginas):
+            raise KeyError(pagina)
+        actual = self.buscar(pagina, contar=False)
+        nuevo_marco = entrada & self.mascara_marco if entrada & self.mascara_presente else None
+
+        if actual is not None and actual == nuevo_marco:
+            self.entradas[actual] = entrada  # sólo cambian bits de control
+            return
+        if actual is not None:
+            self._desenlazar(actual)
+        if nuevo_marco is not None:
+            self._enlazar(nuevo_marco, pagina, entrada)
+            self._no_residentes.pop(pagina, None)
+        elif entrada:
+            self._no_residentes[pagina] = entrada
+        else:
+            self._no_residentes.pop(pagina, None)
+
+    def __contains__(self, pagina):
+        if not (0 <= pagina < self.num_paginas):
+            return False
+        return self.buscar(pagina, contar=False) is not None or pagina in self._no_residentes
+
+    def __len__(self):
+        return self.num_paginas
+
+    def update(self, entradas):
+        for pagina, entrada in entradas.items():
+            self[pagina] = entrada
+
+    def items(self):
+        """Pares (pagina, entrada): residentes y no residentes con bits de control."""
+        for marco in range(self.num_marcos):
+            if self.paginas[marco] != _VACIO:
+                yield self.paginas[marco], self.entradas[marco]
+        yield from self._no_residentes.items()
+
+    # --- estadísticas ---
+
+    def longitudes_cadenas(self):
+        """Longitud de cada cadena no vacía de la tabla de anclas."""
+        longitudes = []
+        for marco in self.anclas:
+            longitud = 0
+            while marco != _VACIO:
+                longitud += 1
+                marco = self.siguiente[marco]
+            if longitud:
+                longitudes.append(longitud)
+        return longitudes
+
+    def bytes_tabla(self):
+        """Memoria que ocuparía en hardware: entradas por marco más la tabla de anclas."""
+        bits_entrada = self.bits_pagina + (self.bits_marco + 1) + _BITS_CONTROL
+        bits_ancla = self.bits_marco + 1  # marco o 'vacío'
+        return self.num_marcos * _bytes_para(bits_entrada) + self.num_anclas * _bytes_para(bits_ancla)
+
+    def reporte(self):
+        longitudes = self.longitudes_cadenas()
+        return {
+            'residentes': self.residentes,
+            'num_anclas': self.num_anclas,
+            'factor_carga': self.residentes / self.num_anclas,
+            'cadenas': len(longitudes),
+            'longitud_media_cadena': sum(longitudes) / len(longitudes) if longitudes else 0.0,
+            'longitud_maxima_cadena': max(longitudes, default=0),
+            'traducciones': self.busquedas_traduccion,
+            'sondeos_traduccion': self.sondeos_traduccion,
+            'sondeos_por_traduccion': (self.sondeos_traduccion / self.busquedas_traduccion
+                                       if self.busquedas_traduccion else 0.0),
+            'busquedas': self.busquedas,
+            'sondeos': self.sondeos,
+            'busquedas_por_traduccion': (self.busquedas / self.busquedas_traduccion
+                                         if self.busquedas_traduccion else 0.0),
+            'bytes': self.bytes_tabla(),
+        }
+
+
+def fabrica_invertida(factor_ancla=2):
+    """Devuelve una fábrica para TraductorDeDirecciones(..., fabrica_tabla=...)."""
+    def _crear(num_paginas, entrada_bits):
+        return TablaPaginasInvertida(num_paginas, entrada_bits, factor_ancla)
+    return _crear
+
+
+class TraductorInvertido(TraductorDeDirecciones):
+    """
+    TraductorDeDirecciones sobre una TablaPaginasInvertida. Mientras atiende un
+    fallo marca la tabla (en_fallo) para que sus lecturas internas no cuenten
+    como búsquedas de traducción.
+    """
+
+    def __init__(self, tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                 entradas_decodificadas=False, factor_ancla=2):
+        super().__init__(tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                         entradas_decodificadas, fabrica_tabla=fabrica_invertida(factor_ancla))
+
+    def _atender_fallo(self, numero_pagina, entrada_packed, verbose=True):
+        tabla = self.tabla_de_paginas
+        tabla.en_fallo = True
+        try:
+            return super()._atender_fallo(numero_pagina, entrada_packed, verbose)
+        finally:
+            tabla.en_fallo = False
+
+
+def bytes_tabla_plana(traductor):
+    """Tabla plana en hardware: una entrada por página virtual, de 1, 2, 4 u 8 bytes."""
+    ancho = next(a for a in (1, 2, 4, 8) if traductor.ENTRADA_BITS <= a * 8)
+    return traductor.num_paginas * ancho
+
+
+def bytes_tabla_jerarquica(paginas, bits_pagina_virtual, bits_por_nivel=9, bytes_entrada=8):
+    """
+    Tabla multinivel (radix) que mapea las páginas dadas: nodos de
+    2^bits_por_nivel entradas, sólo los necesarios. Devuelve (bytes, niveles).
+    """
+    niveles = max(1, math.ceil(bits_pagina_virtual / bits_por_nivel))
+    bytes_nodo = (1 << bits_por_nivel) * bytes_entrada
+    nodos = 0
+    for nivel in range(niveles):
+        desplazamiento = bits_por_nivel * (niveles - nivel)
+        nodos += len({pagina >> desplazamiento for pagina in paginas}) if paginas else (nivel == 0)
+    return nodos * bytes_nodo, niveles
+
+
+def comparar_disenos(traductor, bits_por_nivel=9):
+    """
+    Memoria y accesos a memoria por traducción de la tabla plana, la jerárquica
+    y la invertida (el traductor debe ser un TraductorInvertido). En la invertida,
+    cada traducción lee el ancla y luego las entradas de la cadena; sólo cuentan
+    las búsquedas de traducción, no las lecturas al atender fallos.
+    """
+    tabla = traductor.tabla_de_paginas
+    reporte = tabla.reporte()
+    paginas = [pagina for pagina, _ in tabla.items()]
+    bytes_jerarquica, niveles = bytes_tabla_jerarquica(paginas, traductor.bits_pagina_virtual, bits_por_nivel)
+    return {
+        'plana': {'bytes': bytes_tabla_plana(traductor), 'accesos_por_traduccion': 1.0},
+        'jerarquica': {'bytes': bytes_jerarquica, 'accesos_por_traduccion': float(niveles)},
+        'invertida': {'bytes': reporte['bytes'], 'accesos_por_traduccion': 1.0 + reporte['sondeos_por_traduccion']},
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Traducción con tabla de páginas invertida")
+    parser.add_argument('config', help="archivo de configuración con la sección DIRECCIONES_VI")
+    parser.add_argument('--factor-ancla', type=float, default=2, help="anclas por marco (se redondea a potencia de 2)")
+    parser.add_argument('--bits-por-nivel', type=int, default=9, help="para estimar la tabla jerárquica")
+    args = parser.parse_args()
+
+    try:
+        configuracion, mapas, direcciones_vi_hex = cargar_configuracion_rapida(args.config)
+        traductor = TraductorInvertido(
+            configuracion['TAMANO_MEMORIA_VIRTUAL'],
+            configuracion['TAMANO_MEMORIA_FISICA'],
+            configuracion['TAMANO_PAGINA'],
+            mapas,
+            entradas_decodificadas=True,
+            factor_ancla=args.factor_ancla
+        )
+        for dv in direcciones_vi_hex:
+            traductor.traducir_silencioso(dv)
+        reporte = traductor.tabla_de_paginas.reporte()
+        disenos = comparar_disenos(traductor, args.bits_por_nivel)
+    except (ValueError, KeyError) as e:
+        print(f"❌ Error durante la simulación: {e}")
+        sys.exit(1)
+
+    print(f"\n--- Tabla invertida ---   🔢 Fallos de página: {traductor.fallos_pagina}")
+    for clave, valor in reporte.items():
+        print(f"{clave:<26}{valor:.4f}" if isinstance(valor, float) else f"{clave:<26}{valor}")
+    print(f"\n{'diseño':<12}{'bytes':>14}{'accesos/traducción':>21}")
+    for diseno, datos in disenos.items():
+        print(f"{diseno:<12}{datos['bytes']:>14}{datos['accesos_por_traduccion']:>21.3f}")
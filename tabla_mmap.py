@@ -0,0 +1,148 @@
+#   Tabla de páginas respaldada por un archivo disperso mapeado en memoria.
+#   Las entradas empaquetadas (ENTRADA_BITS de ancho, redondeado a 1, 2, 4 u
+#   8 bytes) se guardan en un archivo creado con truncate(): las regiones que
+#   nunca se tocan son huecos y no ocupan disco, y las que sí se usan quedan
+#   en la caché de páginas del sistema operativo. Así se pueden simular
+#   espacios virtuales (p. ej. 2^36 páginas) mucho más grandes que la RAM.
+#
+#   Uso:
+#     traductor = TraductorDeDirecciones(1 << 48, 1 << 30, 4096, {},
+#                                        fabrica_tabla=fabrica_mmap('/tmp/tabla.bin'))
+
+import os
+import re
+import mmap
+import weakref
+import tempfile
+
+# ancho en bytes -> código de formato para memoryview.cast
+_FORMATOS = ((1, 'B'), (2, 'H'), (4, 'I'), (8, 'Q'))
+# granularidad con la que se recuerdan las zonas escritas del archivo
+_TAMANO_BLOQUE = 4096
+_PATRON_NO_CERO = re.compile(rb'[^\x00]')
+
+
+def _borrar_temporal(ruta):
+    # en POSIX el archivo se puede borrar aunque siga mapeado: el espacio se libera al desmapearlo
+    try:
+        os.remove(ruta)
+    except OSError:
+        pass
+
+
+class TablaPaginasMmap:
+    """
+    Tabla de páginas con la misma interfaz que usa TraductorDeDirecciones sobre
+    su dict (get, [], in, items, update), guardada en un archivo disperso.
+    Una página nunca escrita vale 0, igual que en la tabla dispersa en memoria,
+    y 'pagina in tabla' es True sólo si su entrada es distinta de 0 (en el dict
+    serían las páginas con entrada guardada).
+
+    El archivo temporal (sin ruta) se borra en cerrar() o, si nadie la cierra,
+    cuando la tabla deja de usarse (también si la construcción falla a medias).
+    """
+
+    def __init__(self, num_paginas, entrada_bits, ruta=None):
+        for ancho, formato in _FORMATOS:
+            if entrada_bits <= ancho * 8:
+                break
+        else:
+            raise ValueError(f"Entradas de {entrada_bits} bits no caben en 64 bits")
+
+        self.num_paginas = num_paginas
+        self.ancho_entrada = ancho
+        self.temporal = ruta is None
+        if self.temporal:
+            descriptor, ruta = tempfile.mkstemp(prefix='tabla_paginas_', suffix='.bin')
+            os.close(descriptor)
+            self._finalizador = weakref.finalize(self, _borrar_temporal, ruta)
+        self.ruta = ruta
+
+        self._archivo = open(ruta, 'w+b')
+        # truncate() extiende el archivo sin escribir: todo es un hueco (disperso)
+        self._archivo.truncate(num_paginas * ancho)
+        self._mapa = mmap.mmap(self._archivo.fileno(), num_paginas * ancho)
+        self._vista = memoryview(self._mapa).cast(formato)
+        # bloques del archivo que recibieron alguna escritura; items() sólo recorre estos
+        self._entradas_por_bloque = _TAMANO_BLOQUE // ancho
+        self._bloques_escritos = set()
+
+    # --- interfaz tipo dict ---
+
+    def get(self, pagina, por_defecto=None):
+        if 0 <= pagina < self.num_paginas:
+            return self._vista[pagina]
+        return por_defecto
+
+    def __getitem__(self, pagina):
+        if not (0 <= pagina < self.num_paginas):
+            raise KeyError(pagina)
+        return self._vista[pagina]
+
+    def __setitem__(self, pagina, entrada):
+        if not (0 <= pagina < self.num_paginas):
+            raise KeyError(pagina)
+        self._vista[pagina] = entrada
+        self._bloques_escritos.add(pagina // self._entradas_por_bloque)
+
+    def __contains__(self, pagina):
+        return 0 <= pagina < self.num_paginas and self._vista[pagina] != 0
+
+    def __len__(self):
+        return self.num_paginas
+
+    def update(self, entradas):
+        vista = self._vista
+        bloques = self._bloques_escritos
+        por_bloque = self._entradas_por_bloque
+        for pagina, entrada in entradas.items():
+            if not (0 <= pagina < self.num_paginas):
+                raise KeyError(pagina)
+            vista[pagina] = entrada
+            bloques.add(pagina // por_bloque)
+
+    def items(self):
+        """Pares (pagina, entrada) con entrada != 0, recorriendo sólo los bloques escritos."""
+        vista = self._vista
+        ancho = self.ancho_entrada
+        for bloque in sorted(self._bloques_escritos):
+            inicio = bloque * _TAMANO_BLOQUE
+            ultima = -1
+            # buscar los bytes distintos de cero en C en lugar de entrada por entrada
+            for encontrado in _PATRON_NO_CERO.finditer(self._mapa, inicio, inicio + _TAMANO_BLOQUE):
+                pagina = encontrado.start() // ancho
+                if pagina != ultima:
+                    ultima = pagina
+                    yield pagina, vista[pagina]
+
+    # --- ciclo de vida ---
+
+    def bytes_en_disco(self):
+        """Espacio realmente ocupado por el archivo (los huecos no cuentan)."""
+        return os.fstat(self._archivo.fileno()).st_blocks * 512
+
+    def cerrar(self):
+        if self._mapa.closed:
+            return
+        self._vista.release()
+        self._mapa.close()
+        self._archivo.close()
+        if self.temporal:
+            self._finalizador()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def fabrica_mmap(ruta=None):
+    """
+    Devuelve una fábrica para TraductorDeDirecciones(..., fabrica_tabla=...).
+    Sin ruta se usa un archivo temporal que se borra al cerrar la tabla o al
+    liberarse el traductor que la usa.
+    """
+    def _crear(num_paginas, entrada_bits):
+        return TablaPaginasMmap(num_paginas, entrada_bits, ruta)
+    return _crear
@@ -1,6 +1,26 @@
 import math
-from colorama import Fore, Style, init
-init(autoreset=True)
+
+# Versión de la lógica de simulación: se incrementa cuando un cambio altera los
+# resultados (fallos, reemplazos, estado final), para invalidar resultados en caché
+VERSION_SIMULADOR = 1
+
+_colorama = None
+
+
+def _colores():
+    """
+    Importa e inicializa colorama sólo la primera vez que se necesita imprimir
+    algo con color, para que importar el módulo y construir el traductor no
+    dependa de la capa de presentación. Devuelve (Fore, Style).
+    """
+    global _colorama
+    if _colorama is None:
+        import colorama
+        colorama.init(autoreset=True)
+        _colorama = colorama
+    return _colorama.Fore, _colorama.Style
+
+
 # Su propósito es asegurar que la representación binaria tenga la longitud de bits correcta.
 def imprimir_binario(n, bits):
     """Imprime un número en formato binario con espacios cada 4 bits, agrupando desde la derecha."""
@@ -27,7 +47,8 @@ class TraductorDeDirecciones:
     Incluye algoritmo de reemplazo LFU (Least Frequently Used).
     """
 
-    def __init__(self, tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada):
+    def __init__(self, tamano_memoria_virtual, tamano_memoria_fisica, tamano_pagina, tabla_empaquetada,
+                 entradas_decodificadas=False, fabrica_tabla=None):
         # --- Validaciones iniciales ---
         def es_potencia_de_dos(x):
             return x > 0 and (x & (x - 1)) == 0
@@ -46,6 +67,8 @@ class TraductorDeDirecciones:
             raise ValueError("tamano_memoria_fisica debe ser potencia de 2")
 
         # --- Parámetros básicos ---
+        self.tamano_memoria_virtual = tamano_memoria_virtual
+        self.tamano_memoria_fisica = tamano_memoria_fisica
         self.tamano_pagina = tamano_pagina
         self.num_paginas = tamano_memoria_virtual // tamano_pagina
         self.num_marcos = tamano_memoria_fisica // tamano_pagina
@@ -75,22 +98,47 @@ class TraductorDeDirecciones:
         self.SHIFT_PRESENTE = self.bits_marco  # primer bit del campo control (posición del bit 'presente')
         self.MASK_PRESENTE = 1 << self.SHIFT_PRESENTE  # Aisla el bit P/A
 
-        # tabla de páginas
-        self.tabla_de_paginas = {}
-        # Contadores de uso (frecuencias) por página
+        # tabla de páginas (dispersa: las páginas ausentes equivalen a la entrada 0).
+        # fabrica_tabla(num_paginas, ENTRADA_BITS) permite otro respaldo con la misma
+        # interfaz de dict, p. ej. un archivo mapeado en memoria (ver tabla_mmap.py)
+        self.tabla_de_paginas = {} if fabrica_tabla is None else fabrica_tabla(self.num_paginas, self.ENTRADA_BITS)
+        # Contadores de uso (frecuencias) por página (dispersos: ausente = 0)
         self.frecuencias_uso = {}
         # conjunto de marcos ocupados
         self.marcos_ocupados = set()
+        # todos los marcos por debajo de este número están ocupados (acelera _encontrar_marco_libre)
+        self._pista_marco_libre = 0
+        # páginas con PRESENTE=1: candidatas del reemplazo LFU sin recorrer toda la tabla
+        self._paginas_presentes = set()
         # contador de fallos de página
         self.fallos_pagina = 0
 
-        self._inicializar_tabla_paginas(tabla_empaquetada)
+        if entradas_decodificadas:
+            # valores ya convertidos a int (p. ej. por cargar_configuracion_rapida)
+            self._cargar_entradas_decodificadas(tabla_empaquetada)
+        else:
+            self._inicializar_tabla_paginas(tabla_empaquetada)
 
-        # --- Impresiones informativas ---
+    def restaurar(self, estado):
+        """
+        Deja el traductor (recién creado, con la misma configuración) en un estado
+        guardado: dict con tabla_de_paginas, frecuencias_uso, marcos_ocupados y
+        fallos_pagina. Reconstruye las páginas presentes y la pista de marco libre.
+        """
+        self.tabla_de_paginas.update(estado['tabla_de_paginas'])
+        self.frecuencias_uso = dict(estado['frecuencias_uso'])
+        self.marcos_ocupados = set(estado['marcos_ocupados'])
+        self._pista_marco_libre = 0
+        self._paginas_presentes = {pagina for pagina, entrada in estado['tabla_de_paginas'].items()
+                                   if entrada & self.MASK_PRESENTE}
+        self.fallos_pagina = estado['fallos_pagina']
+
+    def imprimir_parametros(self):
+        """Imprime los parámetros calculados del traductor (la construcción no imprime nada)."""
         print("\n--- Parámetros del Traductor (cargados desde archivo) ---")
-        print(f"Tamaño Memoria Virtual: {tamano_memoria_virtual} bytes")
-        print(f"Tamaño Memoria Física: {tamano_memoria_fisica} bytes")
-        print(f"Tamaño de Página: {tamano_pagina} bytes")
+        print(f"Tamaño Memoria Virtual: {self.tamano_memoria_virtual} bytes")
+        print(f"Tamaño Memoria Física: {self.tamano_memoria_fisica} bytes")
+        print(f"Tamaño de Página: {self.tamano_pagina} bytes")
         print("-" * 40)
         print(f"Número total de páginas: {self.num_paginas}")
         print(f"Número total de marcos: {self.num_marcos}")
@@ -103,22 +151,19 @@ class TraductorDeDirecciones:
         print(f"MASCARA_PRESENTE (hex): 0x{self.MASK_PRESENTE:X} (bit pos {self.SHIFT_PRESENTE})")
         print("\n✅ Tabla de páginas inicializada desde el archivo con valores empaquetados.\n")
 
-        # Imprimir estado inicial
+    def imprimir_estado(self):
+        """Renderiza parámetros, tabla de páginas y tabla de memoria física."""
+        self.imprimir_parametros()
         self.imprimir_tabla_paginas_empaquetada()
-        
 
     def _inicializar_tabla_paginas(self, tabla_empaquetada):
         """
         Inicializa la tabla de páginas, guardando el valor 'empaquetado'
-        (Entrada de Tabla de Páginas) o 0 si no hay entrada. Valida rangos.
-        Además inicializa frecuencias y detecta marcos ocupados.
+        (Entrada de Tabla de Páginas) de las páginas provistas; las demás se
+        consideran 0 sin reservar nada, así el costo no depende de num_paginas.
+        Valida rangos y detecta marcos ocupados.
         """
-        # primero llenar con 0 por defecto y frecuencias en 0
-        for i in range(self.num_paginas):
-            self.tabla_de_paginas[i] = 0
-            self.frecuencias_uso[i] = 0
-
-        # ahora cargar las entradas provistas
+        # cargar las entradas provistas
         for pagina, entrada in tabla_empaquetada.items():
             # asegurar tipos int (por si vienen como strings)
             try:
@@ -142,10 +187,43 @@ class TraductorDeDirecciones:
                     if numero_marco < 0 or numero_marco >= self.num_marcos:
                         raise ValueError(f"Numero de marco {numero_marco} inválido para la página {pagina_int}.")
                     self.marcos_ocupados.add(numero_marco)
+                    self._paginas_presentes.add(pagina_int)
 
             # guardamos tal cual la entrada empaquetada (como en tu versión original)
             self.tabla_de_paginas[pagina_int] = entrada_int
 
+    def _cargar_entradas_decodificadas(self, tabla_decodificada):
+        """
+        Variante en bloque de _inicializar_tabla_paginas para entradas que ya son int.
+        Las validaciones (rango de páginas, ancho de la entrada y rango de marcos)
+        se hacen sobre toda la tabla a la vez en lugar de entrada por entrada.
+        """
+        if not tabla_decodificada:
+            return
+
+        if min(tabla_decodificada) < 0 or max(tabla_decodificada) >= self.num_paginas:
+            pagina_mala = next(p for p in tabla_decodificada if not (0 <= p < self.num_paginas))
+            raise ValueError(f"Página {pagina_mala} inválida (0..{self.num_paginas-1})")
+
+        limite_entrada = 1 << self.ENTRADA_BITS
+        if max(tabla_decodificada.values()) >= limite_entrada:
+            pagina_mala = next(p for p, e in tabla_decodificada.items() if e >= limite_entrada)
+            raise ValueError(f"Entrada empaquetada {tabla_decodificada[pagina_mala]} para página {pagina_mala} "
+                             f"excede los {self.ENTRADA_BITS} bits definidos.")
+
+        # marcos de las entradas con PRESENTE=1
+        mascara_presente, mascara_marco = self.MASK_PRESENTE, self.MASK_MARCO
+        marcos = {e & mascara_marco for e in tabla_decodificada.values() if e & mascara_presente}
+        if marcos and max(marcos) >= self.num_marcos:
+            pagina_mala = next(p for p, e in tabla_decodificada.items()
+                               if e & mascara_presente and (e & mascara_marco) >= self.num_marcos)
+            raise ValueError(f"Numero de marco {tabla_decodificada[pagina_mala] & mascara_marco} "
+                             f"inválido para la página {pagina_mala}.")
+
+        self.marcos_ocupados.update(marcos)
+        self._paginas_presentes.update(p for p, e in tabla_decodificada.items() if e & mascara_presente)
+        self.tabla_de_paginas.update(tabla_decodificada)
+
     def desempaquetar_entrada(self, entrada_packed):
         """
         Devuelve un dict con campos desempaquetados: {'presente': 0/1, 'marco': int, 'raw': entrada_packed}
@@ -156,7 +234,8 @@ class TraductorDeDirecciones:
 
     def imprimir_tabla_paginas_empaquetada(self):
         """Imprime la tabla de páginas con la entrada empaquetada y el valor desempaquetado (con colores)."""
-    
+        Fore, Style = _colores()
+
         # Título principal
         print(f"\n{Fore.CYAN + Style.BRIGHT}📘 Tabla de Páginas:{Style.RESET_ALL}")
         print(Fore.LIGHTYELLOW_EX + "-" * 88)
@@ -167,7 +246,8 @@ class TraductorDeDirecciones:
         print(Fore.LIGHTYELLOW_EX  + "-" * 88)
 
     # Filas de la tabla
-        for i, (pagina, entrada_packed) in enumerate(self.tabla_de_paginas.items()):
+        for pagina in range(self.num_paginas):
+            entrada_packed = self.tabla_de_paginas.get(pagina, 0)
             entrada_bin = imprimir_binario(entrada_packed, self.ENTRADA_BITS).replace(" ", "")
             desem = self.desempaquetar_entrada(entrada_packed)
             marco = desem['marco'] if entrada_packed != 0 else 'n/a'
@@ -176,7 +256,7 @@ class TraductorDeDirecciones:
 
             # Color según si la página está presente
             color_presente = Fore.GREEN if presente == 1 else Fore.RED
-            color_fila = Fore.WHITE if i % 2 == 0 else Fore.LIGHTBLACK_EX  # alternar color filas
+            color_fila = Fore.WHITE if pagina % 2 == 0 else Fore.LIGHTBLACK_EX  # alternar color filas
 
             print(
                 color_fila +
@@ -196,31 +276,50 @@ class TraductorDeDirecciones:
 
 
     def _encontrar_marco_libre(self):
-        """Devuelve el número de un marco libre o None si no hay."""
-        for m in range(self.num_marcos):
+        """Devuelve el número del marco libre más bajo o None si no hay."""
+        if len(self.marcos_ocupados) >= self.num_marcos:
+            return None
+        for m in range(self._pista_marco_libre, self.num_marcos):
             if m not in self.marcos_ocupados:
+                self._pista_marco_libre = m
                 return m
         return None
 
-    def _reemplazar_pagina_LFU(self, pagina_faltante):
-        """Reemplaza la página menos usada (LFU). Devuelve el marco usado."""
-        # buscar páginas presentes
-        paginas_presentes = [p for p, e in self.tabla_de_paginas.items() if self.desempaquetar_entrada(e)['presente'] == 1]
+    def _liberar_marco(self, marco):
+        """Marca un marco como libre. Quien libere marcos debe usar esto para mantener la pista."""
+        self.marcos_ocupados.discard(marco)
+        if marco < self._pista_marco_libre:
+            self._pista_marco_libre = marco
 
-        if not paginas_presentes:
+    def _seleccionar_victima_LFU(self):
+        """Devuelve la página presente menos usada, o None si no hay páginas presentes."""
+        # las páginas presentes se llevan en _paginas_presentes (no hace falta recorrer la tabla)
+        if not self._paginas_presentes:
             return None
+        # si hay empate, min por número de página para determinismo
+        frecuencias = self.frecuencias_uso
+        return min(self._paginas_presentes, key=lambda p: (frecuencias.get(p, 0), p))
 
-        # página menos usada (si hay empate, min por número de página para determinismo)
-        pagina_LFU = min(paginas_presentes, key=lambda p: (self.frecuencias_uso.get(p, 0), p))
+    def _reemplazar_pagina_LFU(self, pagina_faltante, verbose=True):
+        """Reemplaza la página menos usada (LFU). Devuelve el marco usado."""
+        pagina_LFU = self._seleccionar_victima_LFU()
+        if pagina_LFU is None:
+            return None
+        return self._reemplazar_victima(pagina_LFU, pagina_faltante, verbose)
+
+    def _reemplazar_victima(self, pagina_LFU, pagina_faltante, verbose=True):
+        """Desaloja pagina_LFU y le da su marco a pagina_faltante. Devuelve el marco usado."""
         entrada_LFU = self.tabla_de_paginas[pagina_LFU]
-        marco_liberado = self.desempaquetar_entrada(entrada_LFU)['marco']
+        marco_liberado = entrada_LFU & self.MASK_MARCO
 
-        print(f"\n🔁 Reemplazo LFU: Página {pagina_LFU} (uso={self.frecuencias_uso.get(pagina_LFU,0)}) "
-              f"→ será reemplazada por Página {pagina_faltante} usando Marco {marco_liberado}.\n")
+        if verbose:
+            print(f"\n🔁 Reemplazo LFU: Página {pagina_LFU} (uso={self.frecuencias_uso.get(pagina_LFU,0)}) "
+                  f"→ será reemplazada por Página {pagina_faltante} usando Marco {marco_liberado}.\n")
 
         # marcar la reemplazada como no presente (ponemos 0, como en tu versión original)
         entrada_sin_presente = entrada_LFU & (~self.MASK_PRESENTE)
         self.tabla_de_paginas[pagina_LFU] = entrada_sin_presente
+        self._paginas_presentes.discard(pagina_LFU)
         # resetear contador de uso de la reemplazada (opcional)
         self.frecuencias_uso[pagina_LFU] = 0
 
@@ -229,6 +328,7 @@ class TraductorDeDirecciones:
         control_prev = entrada_old & self.MASK_CONTROL  # CORRECCIÓN: conservar otros bits de control
         nueva_entrada = control_prev | (marco_liberado & self.MASK_MARCO) | self.MASK_PRESENTE  # CORRECCIÓN
         self.tabla_de_paginas[pagina_faltante] = nueva_entrada
+        self._paginas_presentes.add(pagina_faltante)
         # marcar uso inicial
         self.frecuencias_uso[pagina_faltante] = 1
 
@@ -236,8 +336,39 @@ class TraductorDeDirecciones:
         # retornar marco asignado
         return marco_liberado
     
+    def _atender_fallo(self, numero_pagina, entrada_packed, verbose=True):
+        """
+        Carga la página faltante en un marco libre o, si no hay, reemplaza por LFU.
+        Devuelve el marco asignado o None si no fue posible. No cuenta el fallo:
+        eso lo hace quien llama.
+        """
+        # Buscar marco libre
+        marco_libre = self._encontrar_marco_libre()
+        if marco_libre is not None:
+            # CORRECCIÓN: preservar bits de control previos y sólo forzar el bit PRESENTE
+            control_prev = entrada_packed & self.MASK_CONTROL  # conserva los otros bits de control (por ejemplo 11000 << bits_marco)
+            nueva_entrada = control_prev | (marco_libre & self.MASK_MARCO) | self.MASK_PRESENTE  # preservar + marco + presente
+            self.tabla_de_paginas[numero_pagina] = nueva_entrada
+            self.marcos_ocupados.add(marco_libre)
+            self._paginas_presentes.add(numero_pagina)
+            self.frecuencias_uso[numero_pagina] = 1
+            if verbose:
+                print(f"   🆕 Se cargó la página {numero_pagina} en el marco libre {marco_libre}.")
+            return marco_libre
+
+        # Reemplazo LFU
+        marco_asignado = self._reemplazar_pagina_LFU(numero_pagina, verbose)
+        if marco_asignado is None:
+            if verbose:
+                print("   ❌ No se pudo realizar reemplazo: no hay páginas presentes.")
+            return None
+        if verbose:
+            print(f"   ✅ Página {numero_pagina} ahora ocupa el marco {marco_asignado} después del reemplazo.")
+        return marco_asignado
+
     def imprimir_tabla_memoria_fisica(self):
         """Muestra la tabla de memoria física: Marco, Página cargada, y frecuencia de uso (con colores)."""
+        Fore, Style = _colores()
         ancho = 44
         print(f"\n{Fore.CYAN + Style.BRIGHT}>>  Tabla de Memoria Física:  <<{Style.RESET_ALL}")
         print(Fore.LIGHTYELLOW_EX + "-" * ancho)
@@ -245,13 +376,16 @@ class TraductorDeDirecciones:
         print(Fore.CYAN + Style.BRIGHT + encabezado)
         print(Fore.LIGHTYELLOW_EX+ "-" * ancho)
 
+        # una sola pasada por la tabla: marco -> página presente (la de menor número si hay varias)
+        pagina_por_marco = {}
+        for pagina, entrada in self.tabla_de_paginas.items():
+            if entrada & self.MASK_PRESENTE:
+                marco = entrada & self.MASK_MARCO
+                if pagina < pagina_por_marco.get(marco, self.num_paginas):
+                    pagina_por_marco[marco] = pagina
+
         for m in range(self.num_marcos):
-            pagina_actual = None
-            for pagina, entrada in self.tabla_de_paginas.items():
-                desem = self.desempaquetar_entrada(entrada)
-                if desem["presente"] == 1 and desem["marco"] == m:
-                    pagina_actual = pagina
-                    break
+            pagina_actual = pagina_por_marco.get(m)
 
             if pagina_actual is not None:
                 frecuencia = self.frecuencias_uso.get(pagina_actual, 0)
@@ -303,11 +437,11 @@ class TraductorDeDirecciones:
         print(f"   Desplazamiento   = {desplazamiento} (bin: {imprimir_binario(desplazamiento, self.bits_desplazamiento)})")
 
         print("\n2. Consulta y Desempaquetado de la Entrada de Páginas:")
-        if numero_pagina not in self.tabla_de_paginas:
+        if not (0 <= numero_pagina < self.num_paginas):
             print(f"   ❌ Error: La página {numero_pagina} es inválida para este espacio de direcciones.")
             return None
 
-        entrada_packed = self.tabla_de_paginas[numero_pagina]
+        entrada_packed = self.tabla_de_paginas.get(numero_pagina, 0)
         entrada_bin_full = imprimir_binario(entrada_packed, self.ENTRADA_BITS).replace(" ", "")
         print(f"   Entrada Empaquetada (Dec): {entrada_packed}")
         print(f"   Entrada Empaquetada (Bin): {entrada_bin_full}")
@@ -324,26 +458,9 @@ class TraductorDeDirecciones:
             self.fallos_pagina += 1
             print(f"   ❌ FALLO DE PÁGINA: La página {numero_pagina} no está cargada en memoria.")
 
-            marco_asignado = None
-
-            # Buscar marco libre
-            marco_libre = self._encontrar_marco_libre()
-            if marco_libre is not None:
-                # CORRECCIÓN: preservar bits de control previos y sólo forzar el bit PRESENTE
-                control_prev = entrada_packed & self.MASK_CONTROL  # conserva los otros bits de control (por ejemplo 11000 << bits_marco)
-                nueva_entrada = control_prev | (marco_libre & self.MASK_MARCO) | self.MASK_PRESENTE  # preservar + marco + presente
-                self.tabla_de_paginas[numero_pagina] = nueva_entrada
-                self.marcos_ocupados.add(marco_libre)
-                self.frecuencias_uso[numero_pagina] = 1
-                marco_asignado = marco_libre
-                print(f"   🆕 Se cargó la página {numero_pagina} en el marco libre {marco_libre}.")
-            else:
-                # Reemplazo LFU
-                marco_asignado = self._reemplazar_pagina_LFU(numero_pagina)
-                if marco_asignado is None:
-                    print("   ❌ No se pudo realizar reemplazo: no hay páginas presentes.")
-                    return None
-                print(f"   ✅ Página {numero_pagina} ahora ocupa el marco {marco_asignado} después del reemplazo.")
+            marco_asignado = self._atender_fallo(numero_pagina, entrada_packed)
+            if marco_asignado is None:
+                return None
 
             # Mostrar tabla actualizada
             self.imprimir_tabla_paginas_empaquetada()
@@ -389,3 +506,104 @@ class TraductorDeDirecciones:
         print(f"🔢 Fallos de página acumulados: {self.fallos_pagina}")
         print("----------------------------------")
         return direccion_fisica
+
+    def traducir_entero(self, direccion_virtual):
+        """
+        Núcleo ligero de traducción: recibe la dirección virtual como int y
+        devuelve la dirección física (int), o None si la página es inválida o
+        no hubo marco disponible. No imprime ni arma cadenas binarias, y en un
+        acierto no crea objetos intermedios: presente y marco se sacan de la
+        entrada empaquetada con las máscaras. Los fallos se cuentan en fallos_pagina.
+        """
+        numero_pagina = direccion_virtual >> self.bits_desplazamiento
+        entrada_packed = self.tabla_de_paginas.get(numero_pagina, 0)
+        if entrada_packed & self.MASK_PRESENTE:
+            frecuencias = self.frecuencias_uso
+            frecuencias[numero_pagina] = frecuencias.get(numero_pagina, 0) + 1
+            return ((entrada_packed & self.MASK_MARCO) << self.bits_desplazamiento) | (direccion_virtual & self.mascara_desplazamiento)
+
+        if not (0 <= numero_pagina < self.num_paginas):
+            return None
+        self.fallos_pagina += 1
+        marco_asignado = self._atender_fallo(numero_pagina, entrada_packed, verbose=False)
+        if marco_asignado is None:
+            return None
+        return (marco_asignado << self.bits_desplazamiento) | (direccion_virtual & self.mascara_desplazamiento)
+
+    def traducir_lote(self, direcciones, posiciones_fallo=None):
+        """
+        Traduce una secuencia de direcciones virtuales (int) y devuelve la lista
+        de direcciones físicas (None donde la dirección es inválida). Es el mismo
+        cálculo que traducir_entero con los atributos ya copiados a variables
+        locales, para la máxima cantidad de accesos por segundo. Si se pasa la
+        lista posiciones_fallo, se le agrega el índice de cada acceso que falló.
+        """
+        tabla = self.tabla_de_paginas
+        frecuencias = self.frecuencias_uso
+        obtener_entrada = tabla.get
+        obtener_frecuencia = frecuencias.get
+        bits = self.bits_desplazamiento
+        mascara_desplazamiento = self.mascara_desplazamiento
+        mascara_presente = self.MASK_PRESENTE
+        mascara_marco = self.MASK_MARCO
+        num_paginas = self.num_paginas
+        atender_fallo = self._atender_fallo
+
+        resultados = []
+        agregar = resultados.append
+        for direccion_virtual in direcciones:
+            numero_pagina = direccion_virtual >> bits
+            entrada_packed = obtener_entrada(numero_pagina, 0)
+            if entrada_packed & mascara_presente:
+                frecuencias[numero_pagina] = obtener_frecuencia(numero_pagina, 0) + 1
+                agregar(((entrada_packed & mascara_marco) << bits) | (direccion_virtual & mascara_desplazamiento))
+                continue
+            if not (0 <= numero_pagina < num_paginas):
+                agregar(None)
+                continue
+            self.fallos_pagina += 1
+            if posiciones_fallo is not None:
+                posiciones_fallo.append(len(resultados))
+            marco_asignado = atender_fallo(numero_pagina, entrada_packed, False)
+            agregar(None if marco_asignado is None else (marco_asignado << bits) | (direccion_virtual & mascara_desplazamiento))
+        return resultados
+
+    def traducir_silencioso(self, direccion_virtual):
+        """
+        Igual que traducir() pero sin imprimir nada, para simulaciones y servicios.
+        Acepta un int o un string hexadecimal. Devuelve (direccion_fisica, hubo_fallo);
+        direccion_fisica es None si la dirección es inválida o no hubo marco disponible.
+        """
+        if not isinstance(direccion_virtual, int):
+            try:
+                direccion_virtual = int(str(direccion_virtual), 16)
+            except ValueError:
+                return None, False
+
+        fallos_previos = self.fallos_pagina
+        direccion_fisica = self.traducir_entero(direccion_virtual)
+        return direccion_fisica, self.fallos_pagina != fallos_previos
+
+    def aplicar_racha(self, numero_pagina, cuenta):
+        """
+        Aplica de una vez 'cuenta' accesos consecutivos a la misma página (ver
+        reduccion_traza.py). El resultado final (tabla, frecuencias, fallos y
+        reemplazos) es el mismo que traducir cada acceso por separado: sólo el
+        primero puede fallar y los demás sólo suman a frecuencias_uso.
+        Devuelve True si el primer acceso provocó fallo, False si no, o None si la página es inválida.
+        """
+        if cuenta <= 0 or not (0 <= numero_pagina < self.num_paginas):
+            return None
+
+        entrada_packed = self.tabla_de_paginas.get(numero_pagina, 0)
+        if entrada_packed & self.MASK_PRESENTE:
+            self.frecuencias_uso[numero_pagina] = self.frecuencias_uso.get(numero_pagina, 0) + cuenta
+            return False
+
+        self.fallos_pagina += 1
+        if self._atender_fallo(numero_pagina, entrada_packed, verbose=False) is None:
+            # sin marco disponible cada acceso de la racha vuelve a fallar
+            self.fallos_pagina += cuenta - 1
+            return True
+        self.frecuencias_uso[numero_pagina] += cuenta - 1
+        return True